@@ -1,7 +1,68 @@
 from typing import List, Dict, Any, Optional, Tuple
+import bisect
+import functools
+import os
 import re
 import logging
 
+_getsize = os.path.getsize
+_exists = os.path.exists
+
+# Excel sheet name restrictions: these characters are replaced with '_'
+_SHEET_INVALID = str.maketrans({c: '_' for c in r'\/?*[]:'})
+
+# Supported Excel file extensions (lowercase)
+_VALID_EXTS = ('.xlsx', '.xlsm', '.xls')
+
+# Vietnamese-specific characters. Every one of them (in either case) lives in
+# U+00C0..U+01BF or U+1EA0..U+1EFF, so membership is a bit test in a bitmap
+_VIETNAMESE_CHARS = 'àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ'
+_VI_BASE_A, _VI_SIZE_A = 0x00C0, 0x100
+_VI_BASE_B, _VI_SIZE_B = 0x1EA0, 0x60
+
+def _build_vietnamese_bitmap(base: int, size: int) -> bytes:
+    """Build a bitmap with bit i set iff codepoint base + i is Vietnamese."""
+    bitmap = bytearray((size + 7) >> 3)
+    for char in _VIETNAMESE_CHARS + _VIETNAMESE_CHARS.upper():
+        idx = ord(char) - base
+        if 0 <= idx < size:
+            bitmap[idx >> 3] |= 1 << (idx & 7)
+    return bytes(bitmap)
+
+_VI_BITMAP_A = _build_vietnamese_bitmap(_VI_BASE_A, _VI_SIZE_A)
+_VI_BITMAP_B = _build_vietnamese_bitmap(_VI_BASE_B, _VI_SIZE_B)
+
+# Batch size tuning: bucket boundaries and the factor applied per bucket
+_BATCH_TEXT_BOUNDS = (100, 500, 1000)
+_BATCH_TEXT_FACTORS = (
+    0.6,  # Small files - use smaller batches for better responsiveness
+    1.0,  # Medium files - use standard batches
+    1.5,  # Large files - use larger batches for efficiency
+    2.0,  # Very large files - use large batches
+)
+_BATCH_LENGTH_BOUNDS = (50, 200)
+_BATCH_LENGTH_FACTORS = (
+    1.2,  # Short texts - can handle more per batch
+    1.0,  # Medium texts - standard batch size
+    0.7,  # Long texts - use smaller batches to avoid API limits
+)
+_BATCH_SIZE_BOUNDS = (1, 5)
+_BATCH_SIZE_FACTORS = (0.8, 1.0, 1.3)  # Small, medium, large files
+
+def _build_batch_table() -> Dict[Tuple[int, int, int], int]:
+    """Precompute the optimal batch size for every bucket combination."""
+    base_batch_size = 50
+    table = {}
+    for text_key, text_factor in enumerate(_BATCH_TEXT_FACTORS):
+        for length_key, length_factor in enumerate(_BATCH_LENGTH_FACTORS):
+            for size_key, size_factor in enumerate(_BATCH_SIZE_FACTORS):
+                optimal_size = int(base_batch_size * text_factor * length_factor * size_factor)
+                # Ensure batch size is within reasonable bounds (10 to 200)
+                table[(text_key, length_key, size_key)] = max(10, min(optimal_size, 200))
+    return table
+
+_BATCH_TABLE = _build_batch_table()
+
 def is_text_cell(value: Any) -> bool:
     """Check if a cell value contains translatable text.
     
@@ -46,13 +107,25 @@ def detect_language(text: str) -> str:
         return "ja"
     
     # Vietnamese detection (Vietnamese-specific characters)
-    vietnamese_chars = re.findall(r'[àáạảãâầấậẩẫăằắặẳẵèéẹẻẽêềếệểễìíịỉĩòóọỏõôồốộổỗơờớợởỡùúụủũưừứựửữỳýỵỷỹđ]', text.lower())
-    if len(vietnamese_chars) > 0:
+    if _contains_vietnamese(text):
         return "vi"
     
     # Default to English if no specific patterns found
     return "en"
 
+def _contains_vietnamese(text: str) -> bool:
+    """Check whether text contains any Vietnamese-specific character."""
+    for char in text:
+        idx = ord(char) - _VI_BASE_A
+        if 0 <= idx < _VI_SIZE_A:
+            if (_VI_BITMAP_A[idx >> 3] >> (idx & 7)) & 1:
+                return True
+            continue
+        idx -= _VI_BASE_B - _VI_BASE_A
+        if 0 <= idx < _VI_SIZE_B and (_VI_BITMAP_B[idx >> 3] >> (idx & 7)) & 1:
+            return True
+    return False
+
 def clean_text_for_translation(text: str) -> str:
     """Clean text for better translation quality.
     
@@ -150,8 +223,7 @@ def get_file_size_mb(file_path: str) -> float:
         File size in MB
     """
     try:
-        import os
-        size_bytes = os.path.getsize(file_path)
+        size_bytes = _getsize(file_path)
         return size_bytes / (1024 * 1024)
     except Exception:
         return 0.0
@@ -234,15 +306,21 @@ def create_progress_message(current: int, total: int, item_name: str = "items")
         Progress message string
     """
     if total == 0:
-        return f"Processing {item_name}..."
+        return _idle_progress_message(item_name)
     
-    percentage = int((current / total) * 100)
+    percentage = (current * 100) // total
     return f"Processing {item_name}: {current}/{total} ({percentage}%)"
 
+@functools.lru_cache(maxsize=32)
+def _idle_progress_message(item_name: str) -> str:
+    """Build the progress message used before the total is known."""
+    return f"Processing {item_name}..."
+
 class ExcelUtils:
     """Utility class for Excel-related operations."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_safe_sheet_name(name: str) -> str:
         """Get a safe sheet name for Excel.
         
@@ -252,18 +330,8 @@ class ExcelUtils:
         Returns:
             Safe sheet name
         """
-        # Excel sheet name restrictions
-        invalid_chars = ['\\', '/', '?', '*', '[', ']', ':']
-        safe_name = name
-        
-        for char in invalid_chars:
-            safe_name = safe_name.replace(char, '_')
-        
-        # Limit length to 31 characters
-        if len(safe_name) > 31:
-            safe_name = safe_name[:31]
-        
-        return safe_name
+        # Replace invalid characters and limit length to 31 characters
+        return name.translate(_SHEET_INVALID)[:31]
     
     @staticmethod
     def is_valid_excel_file(file_path: str) -> bool:
@@ -276,15 +344,11 @@ class ExcelUtils:
             True if the file is a valid Excel file
         """
         try:
-            import os
-            if not os.path.exists(file_path):
-                return False
-            
-            # Check file extension
-            valid_extensions = ['.xlsx', '.xlsm', '.xls']
-            _, ext = os.path.splitext(file_path)
-            
-            return ext.lower() in valid_extensions
+            file_path = os.fspath(file_path)
+            # splitext treats a bare '.xlsx' as a name without an extension;
+            # lowercasing keeps mixed-case names like 'Report.Xlsx' valid
+            return (os.path.splitext(file_path)[1].lower() in _VALID_EXTS
+                    and _exists(file_path))
         except Exception:
             return False
     
@@ -300,58 +364,13 @@ class ExcelUtils:
         Returns:
             Optimal batch size
         """
-        # Base batch size
-        base_batch_size = 50
-        
-        # Adjust based on total number of texts
-        if total_texts < 100:
-            # Small files - use smaller batches for better responsiveness
-            text_factor = 0.6
-        elif total_texts < 500:
-            # Medium files - use standard batches
-            text_factor = 1.0
-        elif total_texts < 1000:
-            # Large files - use larger batches for efficiency
-            text_factor = 1.5
-        else:
-            # Very large files - use large batches
-            text_factor = 2.0
-        
-        # Adjust based on average text length
-        if avg_text_length > 0:
-            if avg_text_length < 50:
-                # Short texts - can handle more per batch
-                length_factor = 1.2
-            elif avg_text_length < 200:
-                # Medium texts - standard batch size
-                length_factor = 1.0
-            else:
-                # Long texts - use smaller batches to avoid API limits
-                length_factor = 0.7
-        else:
-            length_factor = 1.0
-        
-        # Adjust based on file size
-        if file_size_mb > 0:
-            if file_size_mb < 1:
-                # Small files
-                size_factor = 0.8
-            elif file_size_mb < 5:
-                # Medium files
-                size_factor = 1.0
-            else:
-                # Large files
-                size_factor = 1.3
-        else:
-            size_factor = 1.0
-        
-        # Calculate optimal batch size
-        optimal_size = int(base_batch_size * text_factor * length_factor * size_factor)
-        
-        # Ensure batch size is within reasonable bounds
-        optimal_size = max(10, min(optimal_size, 200))  # Between 10 and 200
+        # Texts: <100, <500, <1000, more. Length and size: small, standard
+        # (also used when unknown), large. See _BATCH_TABLE for the factors
+        text_key = bisect.bisect_right(_BATCH_TEXT_BOUNDS, total_texts)
+        length_key = bisect.bisect_right(_BATCH_LENGTH_BOUNDS, avg_text_length) if avg_text_length > 0 else 1
+        size_key = bisect.bisect_right(_BATCH_SIZE_BOUNDS, file_size_mb) if file_size_mb > 0 else 1
         
-        return optimal_size
+        return _BATCH_TABLE[(text_key, length_key, size_key)]
 
     @staticmethod
     def analyze_file_characteristics(file_path: str, sheet_info: Dict[str, Dict]) -> Dict[str, Any]:
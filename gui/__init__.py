@@ -4,9 +4,23 @@ GUI Layer Package
 This package contains all GUI-related components, styles, and windows for the Excel Translator application.
 """
 
-from .components import *
+from . import resources  # Registers the asset search paths used by the stylesheets
+from . import components  # Only registers the lazy component names
 from .styles import get_application_stylesheet
 
 __all__ = [
     'get_application_stylesheet'
 ]
+
+
+def __getattr__(name):
+    """Resolve component classes lazily through the components package."""
+    if name not in components.__all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(components, name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(components.__all__))
@@ -2,39 +2,56 @@
 GUI Components Package
 
 This package contains all UI components for the Excel Translator application.
+Components are imported lazily on first access so that only the widgets a
+window actually uses get loaded.
 """
 
-from .button import *
-from .combo_box import *
-from .progress_bar import *
-from .drag_and_drop import *
-from .check_box import *
+import importlib
 
-__all__ = [
+# Component name -> (submodule, attribute)
+_LAZY_MAP = {
     # Button components
-    'TranslateButton',
-    'CancelButton', 
-    'ExportButton',
-    'SelectFileButton',
-    'SwapButton',
+    'TranslateButton': ('.button.translate_button', 'TranslateButton'),
+    'CancelButton': ('.button.cancel_button', 'CancelButton'),
+    'ExportButton': ('.button.export_button', 'ExportButton'),
+    'SelectFileButton': ('.button.select_file_button', 'SelectFileButton'),
+    'SwapButton': ('.button.swap_button', 'SwapButton'),
     
     # Combo box components
-    'SourceLanguageComboBox',
-    'TargetLanguageComboBox',
-    'FormatComboBox',
+    'SourceLanguageComboBox': ('.combo_box.source_language_combo_box', 'SourceLanguageComboBox'),
+    'TargetLanguageComboBox': ('.combo_box.target_language_combo_box', 'TargetLanguageComboBox'),
+    'FormatComboBox': ('.combo_box.format_combo_box', 'FormatComboBox'),
     
     # Progress bar components
-    'TranslationProgressBar',
-    'ProgressBarContainer',
-    'FileProgressBar', 
-    'FileProgressWidget',
-    'FileOperationType',
+    'TranslationProgressBar': ('.progress_bar.translation_progress_bar', 'TranslationProgressBar'),
+    'ProgressBarContainer': ('.progress_bar.translation_progress_bar', 'ProgressBarContainer'),
+    'FileProgressBar': ('.progress_bar.file_progress_bar', 'FileProgressBar'),
+    'FileProgressWidget': ('.progress_bar.file_progress_bar', 'FileProgressWidget'),
+    'FileOperationType': ('.progress_bar.file_progress_bar', 'FileOperationType'),
     
     # Drag and drop components
-    'FileDropZone',
+    'FileDropZone': ('.drag_and_drop.file_drop_zone', 'FileDropZone'),
     
     # Check box components
-    'OptionsCheckBox',
-    'TranslationOptionsGroup',
-    'AdvancedOptionsGroup'
-]
+    'OptionsCheckBox': ('.check_box.options_check_box', 'OptionsCheckBox'),
+    'TranslationOptionsGroup': ('.check_box.options_check_box', 'TranslationOptionsGroup'),
+    'AdvancedOptionsGroup': ('.check_box.options_check_box', 'AdvancedOptionsGroup'),
+}
+
+__all__ = list(_LAZY_MAP)
+
+
+def __getattr__(name):
+    """Import a component from its submodule on first access."""
+    try:
+        module, attr = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
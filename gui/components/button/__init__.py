@@ -2,18 +2,34 @@
 Button Components Package
 
 This package contains all button-related UI components for the Excel Translator application.
+Buttons are imported lazily on first access.
 """
 
-from .translate_button import TranslateButton
-from .cancel_button import CancelButton
-from .export_button import ExportButton
-from .select_file_button import SelectFileButton
-from .swap_button import SwapButton
-
-__all__ = [
-    'TranslateButton',
-    'CancelButton', 
-    'ExportButton',
-    'SelectFileButton',
-    'SwapButton'
-]
+import importlib
+
+# Button name -> (submodule, attribute)
+_LAZY_MAP = {
+    'TranslateButton': ('.translate_button', 'TranslateButton'),
+    'CancelButton': ('.cancel_button', 'CancelButton'),
+    'ExportButton': ('.export_button', 'ExportButton'),
+    'SelectFileButton': ('.select_file_button', 'SelectFileButton'),
+    'SwapButton': ('.swap_button', 'SwapButton'),
+}
+
+__all__ = list(_LAZY_MAP)
+
+
+def __getattr__(name):
+    """Import a button from its submodule on first access."""
+    try:
+        module, attr = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,7 +6,7 @@ Custom button for canceling operations.
 
 from PyQt6.QtWidgets import QPushButton, QWidget
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QIcon
+from gui.resources import load_icon
 from typing import Optional
 
 
@@ -15,6 +15,9 @@ class CancelButton(QPushButton):
     
     cancel_requested = pyqtSignal()
     
+    # Tooltip shown when no specific one is given
+    _DEFAULT_TOOLTIP = ""
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize cancel button."""
         super().__init__("Cancel", parent)
@@ -26,32 +29,6 @@ class CancelButton(QPushButton):
         """Setup button appearance and properties."""
         self.setMinimumHeight(40)
         self.setMinimumWidth(100)
-        
-        # Apply styling
-        self.setStyleSheet("""
-            CancelButton {
-                background-color: #d13438;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            
-            CancelButton:hover {
-                background-color: #b02a2f;
-            }
-            
-            CancelButton:pressed {
-                background-color: #8e2025;
-            }
-            
-            CancelButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
     
     def _connect_signals(self) -> None:
         """Connect button signals."""
@@ -68,15 +45,12 @@ class CancelButton(QPushButton):
     def set_enabled_with_tooltip(self, enabled: bool, tooltip: str = "") -> None:
         """Set enabled state with optional tooltip."""
         self.setEnabled(enabled)
-        if tooltip:
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip("")
+        self.setToolTip(tooltip or self._DEFAULT_TOOLTIP)
     
     def set_icon_from_path(self, icon_path: str) -> None:
-        """Set button icon from file path."""
+        """Set button icon from a file path or an "icons:" resource path."""
         try:
-            icon = QIcon(icon_path)
+            icon = load_icon(icon_path)
             self.setIcon(icon)
         except Exception:
             pass  # Ignore icon loading errors
@@ -6,7 +6,7 @@ Custom button for incrementing numeric values.
 
 from PyQt6.QtWidgets import QPushButton, QWidget
 from PyQt6.QtCore import pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon
+from gui.resources import load_icon
 from typing import Optional
 
 
@@ -15,6 +15,9 @@ class IncrementButton(QPushButton):
     
     increment_requested = pyqtSignal()
     
+    # Tooltip shown when no specific one is given
+    _DEFAULT_TOOLTIP = "Increment value"
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize increment button."""
         super().__init__("+", parent)
@@ -35,33 +38,8 @@ class IncrementButton(QPushButton):
         self.setMaximumHeight(25)
         self.setMaximumWidth(25)
         
-        # Apply styling
-        self.setStyleSheet("""
-            IncrementButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            
-            IncrementButton:hover {
-                background-color: #106ebe;
-            }
-            
-            IncrementButton:pressed {
-                background-color: #005a9e;
-            }
-            
-            IncrementButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
-        
         # Set tooltip
-        self.setToolTip("Increment value")
+        self.setToolTip(self._DEFAULT_TOOLTIP)
     
     def _connect_signals(self) -> None:
         """Connect button signals."""
@@ -96,15 +74,12 @@ class IncrementButton(QPushButton):
     def set_enabled_with_tooltip(self, enabled: bool, tooltip: str = "") -> None:
         """Set enabled state with optional tooltip."""
         self.setEnabled(enabled)
-        if tooltip:
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip("Increment value")
+        self.setToolTip(tooltip or self._DEFAULT_TOOLTIP)
     
     def set_icon_from_path(self, icon_path: str) -> None:
-        """Set button icon from file path."""
+        """Set button icon from a file path or an "icons:" resource path."""
         try:
-            icon = QIcon(icon_path)
+            icon = load_icon(icon_path)
             self.setIcon(icon)
             self.setText("")  # Remove text when icon is set
         except Exception:
@@ -6,7 +6,7 @@ Custom button for file selection operations.
 
 from PyQt6.QtWidgets import QPushButton, QWidget, QFileDialog
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QIcon
+from gui.resources import load_icon
 from typing import Optional
 
 
@@ -15,6 +15,9 @@ class SelectFileButton(QPushButton):
     
     file_selected = pyqtSignal(str)  # Emits selected file path
     
+    # Tooltip shown when no specific one is given
+    _DEFAULT_TOOLTIP = ""
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize select file button."""
         super().__init__("Select File", parent)
@@ -30,32 +33,6 @@ class SelectFileButton(QPushButton):
         """Setup button appearance and properties."""
         self.setMinimumHeight(40)
         self.setMinimumWidth(120)
-        
-        # Apply styling
-        self.setStyleSheet("""
-            SelectFileButton {
-                background-color: #5c2d91;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            
-            SelectFileButton:hover {
-                background-color: #4a237a;
-            }
-            
-            SelectFileButton:pressed {
-                background-color: #3a1c63;
-            }
-            
-            SelectFileButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
     
     def _connect_signals(self) -> None:
         """Connect button signals."""
@@ -92,15 +69,12 @@ class SelectFileButton(QPushButton):
     def set_enabled_with_tooltip(self, enabled: bool, tooltip: str = "") -> None:
         """Set enabled state with optional tooltip."""
         self.setEnabled(enabled)
-        if tooltip:
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip("")
+        self.setToolTip(tooltip or self._DEFAULT_TOOLTIP)
     
     def set_icon_from_path(self, icon_path: str) -> None:
-        """Set button icon from file path."""
+        """Set button icon from a file path or an "icons:" resource path."""
         try:
-            icon = QIcon(icon_path)
+            icon = load_icon(icon_path)
             self.setIcon(icon)
         except Exception:
             pass  # Ignore icon loading errors
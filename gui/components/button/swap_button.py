@@ -5,8 +5,8 @@ Custom button for swapping source and target languages.
 """
 
 from PyQt6.QtWidgets import QPushButton, QWidget
-from PyQt6.QtCore import pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QIcon, QTransform, QPainter
+from PyQt6.QtCore import pyqtSignal, QTimer
+from gui.resources import load_icon
 from typing import Optional
 
 
@@ -15,11 +15,18 @@ class SwapButton(QPushButton):
     
     swap_requested = pyqtSignal()
     
+    # Tooltip shown when no specific one is given
+    _DEFAULT_TOOLTIP = "Swap source and target languages"
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize swap button."""
         super().__init__("⇄", parent)
         
-        self.rotation_animation = None
+        # Single-shot timer that restores the text after the swap feedback
+        self._saved_text = self.text()
+        self._restore_timer = QTimer(self)
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.timeout.connect(self._restore_text)
         
         self._setup_button()
         self._connect_signals()
@@ -31,33 +38,8 @@ class SwapButton(QPushButton):
         self.setMaximumHeight(35)
         self.setMaximumWidth(35)
         
-        # Apply styling
-        self.setStyleSheet("""
-            SwapButton {
-                background-color: #666666;
-                color: white;
-                border: none;
-                border-radius: 17px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            
-            SwapButton:hover {
-                background-color: #777777;
-            }
-            
-            SwapButton:pressed {
-                background-color: #555555;
-            }
-            
-            SwapButton:disabled {
-                background-color: #cccccc;
-                color: #888888;
-            }
-        """)
-        
         # Set tooltip
-        self.setToolTip("Swap source and target languages")
+        self.setToolTip(self._DEFAULT_TOOLTIP)
     
     def _connect_signals(self) -> None:
         """Connect button signals."""
@@ -70,27 +52,26 @@ class SwapButton(QPushButton):
     
     def _animate_rotation(self) -> None:
         """Animate button rotation."""
-        # Simple visual feedback - change text temporarily
-        original_text = self.text()
+        # Simple visual feedback - change text temporarily. Repeated clicks
+        # only restart the timer so the original text is never lost
+        if not self._restore_timer.isActive():
+            self._saved_text = self.text()
         self.setText("↻")
-        
-        # Use QTimer for simple animation
-        from PyQt6.QtCore import QTimer
-        timer = QTimer()
-        timer.singleShot(200, lambda: self.setText(original_text))
+        self._restore_timer.start(200)
+    
+    def _restore_text(self) -> None:
+        """Restore the text shown before the rotation feedback."""
+        self.setText(self._saved_text)
     
     def set_enabled_with_tooltip(self, enabled: bool, tooltip: str = "") -> None:
         """Set enabled state with optional tooltip."""
         self.setEnabled(enabled)
-        if tooltip:
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip("Swap source and target languages")
+        self.setToolTip(tooltip or self._DEFAULT_TOOLTIP)
     
     def set_icon_from_path(self, icon_path: str) -> None:
-        """Set button icon from file path."""
+        """Set button icon from a file path or an "icons:" resource path."""
         try:
-            icon = QIcon(icon_path)
+            icon = load_icon(icon_path)
             self.setIcon(icon)
             self.setText("")  # Remove text when icon is set
         except Exception:
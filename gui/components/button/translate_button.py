@@ -6,7 +6,8 @@ Custom button for initiating translation operations.
 
 from PyQt6.QtWidgets import QPushButton, QWidget
 from PyQt6.QtCore import pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QHideEvent, QShowEvent
+from gui.resources import load_icon
 from typing import Optional, Callable
 
 
@@ -15,6 +16,12 @@ class TranslateButton(QPushButton):
     
     translation_requested = pyqtSignal()
     
+    # Tooltip shown when no specific one is given
+    _DEFAULT_TOOLTIP = ""
+    
+    # Processing animation tick in ms
+    ANIMATION_INTERVAL = 800
+    
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize translate button."""
         super().__init__("Translate", parent)
@@ -24,7 +31,7 @@ class TranslateButton(QPushButton):
         self.is_processing = False
         
         # Animation timer for processing state
-        self.animation_timer = QTimer()
+        self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self._update_processing_animation)
         self.animation_dots = 0
         
@@ -35,37 +42,6 @@ class TranslateButton(QPushButton):
         """Setup button appearance and properties."""
         self.setMinimumHeight(40)
         self.setMinimumWidth(120)
-        
-        # Apply styling
-        self.setStyleSheet("""
-            TranslateButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 16px;
-            }
-            
-            TranslateButton:hover {
-                background-color: #106ebe;
-            }
-            
-            TranslateButton:pressed {
-                background-color: #005a9e;
-            }
-            
-            TranslateButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            
-            TranslateButton[processing="true"] {
-                background-color: #ffa500;
-                color: white;
-            }
-        """)
     
     def _connect_signals(self) -> None:
         """Connect button signals."""
@@ -80,31 +56,54 @@ class TranslateButton(QPushButton):
         """Set button to processing state."""
         self.is_processing = True
         self.setEnabled(False)
-        self.setProperty("processing", True)
-        self.style().polish(self)
+        self._apply_processing_style(True)
         
         # Start animation
         self.animation_dots = 0
-        self.animation_timer.start(500)  # Update every 500ms
+        if self.isVisible():
+            self.animation_timer.start(self.ANIMATION_INTERVAL)
         self._update_processing_animation()
     
     def stop_processing(self) -> None:
         """Stop processing state and return to normal."""
         self.is_processing = False
         self.setEnabled(True)
-        self.setProperty("processing", False)
-        self.style().polish(self)
+        self._apply_processing_style(False)
         
         # Stop animation
         self.animation_timer.stop()
         self.setText(self.original_text)
     
+    def _apply_processing_style(self, processing: bool) -> None:
+        """Update the processing property, repolishing only when it changes."""
+        if bool(self.property("processing")) == processing:
+            return
+        
+        self.setProperty("processing", processing)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+    
     def _update_processing_animation(self) -> None:
         """Update processing animation."""
-        if self.is_processing:
-            dots = "." * (self.animation_dots % 4)
-            self.setText(f"{self.processing_text}{dots}")
-            self.animation_dots += 1
+        if not self.is_processing or not self.isVisible():
+            return
+        
+        dots = "." * (self.animation_dots % 4)
+        self.setText(f"{self.processing_text}{dots}")
+        self.animation_dots += 1
+    
+    def showEvent(self, event: QShowEvent) -> None:
+        """Resume the processing animation when shown."""
+        super().showEvent(event)
+        if self.is_processing and not self.animation_timer.isActive():
+            self.animation_timer.start(self.ANIMATION_INTERVAL)
+            self._update_processing_animation()
+    
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Pause the processing animation while hidden."""
+        super().hideEvent(event)
+        self.animation_timer.stop()
     
     def set_text(self, text: str) -> None:
         """Set button text."""
@@ -119,15 +118,12 @@ class TranslateButton(QPushButton):
     def set_enabled_with_tooltip(self, enabled: bool, tooltip: str = "") -> None:
         """Set enabled state with optional tooltip."""
         self.setEnabled(enabled)
-        if tooltip:
-            self.setToolTip(tooltip)
-        else:
-            self.setToolTip("")
+        self.setToolTip(tooltip or self._DEFAULT_TOOLTIP)
     
     def set_icon_from_path(self, icon_path: str) -> None:
-        """Set button icon from file path."""
+        """Set button icon from a file path or an "icons:" resource path."""
         try:
-            icon = QIcon(icon_path)
+            icon = load_icon(icon_path)
             self.setIcon(icon)
         except Exception:
             pass  # Ignore icon loading errors
@@ -136,4 +132,4 @@ class TranslateButton(QPushButton):
         """Reset button to initial state."""
         self.stop_processing()
         self.setEnabled(True)
-        self.setToolTip("")
+        self.setToolTip(self._DEFAULT_TOOLTIP)
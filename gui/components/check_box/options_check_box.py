@@ -5,8 +5,11 @@ Modern QCheckBox implementation for translation options.
 """
 
 from PyQt6.QtWidgets import QCheckBox, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox
-from PyQt6.QtCore import pyqtSignal, Qt
-from typing import Dict, List, Optional
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSignalBlocker
+from typing import ClassVar, Dict, List, Optional, Tuple
+
+# stateChanged delivers the raw int value of Qt.CheckState
+_CHECKED_VALUE = Qt.CheckState.Checked.value
 
 
 class OptionsCheckBox(QCheckBox):
@@ -15,6 +18,20 @@ class OptionsCheckBox(QCheckBox):
     # Signals
     option_changed = pyqtSignal(str, bool)  # Emits option name and state
     
+    # Known options: name -> (display name, tooltip)
+    _OPTION_META: ClassVar[Dict[str, Tuple[str, str]]] = {
+        'preserve_formatting': ('Preserve Formatting', 'Maintain cell formatting like bold, italic, colors'),
+        'skip_empty_cells': ('Skip Empty Cells', 'Do not translate empty or whitespace-only cells'),
+        'skip_formulas': ('Skip Formulas', 'Skip cells containing Excel formulas'),
+        'skip_headers': ('Skip Headers', 'Skip the first row (typically headers)'),
+        'case_sensitive': ('Case Sensitive', 'Preserve original text casing in translation'),
+        'batch_processing': ('Batch Processing', 'Process multiple cells together for better context'),
+        'auto_detect_language': ('Auto Detect Language', 'Automatically detect source language'),
+        'preserve_hyperlinks': ('Preserve Hyperlinks', 'Maintain clickable links in cells'),
+        'backup_original': ('Backup Original', 'Create backup copy of original file'),
+        'show_progress': ('Show Progress', 'Display detailed progress information'),
+    }
+    
     def __init__(self, option_name: str, description: str = "", parent=None):
         """
         Initialize the options checkbox.
@@ -33,7 +50,14 @@ class OptionsCheckBox(QCheckBox):
     def _setup_ui(self):
         """Set up the UI components."""
         self.setObjectName(f"option_{self._option_name}")
-        self.setText(self._description or self._option_name.replace('_', ' ').title())
+        self.setProperty("class", "option")  # Matched by QCheckBox.option in the stylesheet
+        self._meta = self._OPTION_META.get(self._option_name)
+        if self._description:
+            self.setText(self._description)
+        elif self._meta:
+            self.setText(self._meta[0])
+        else:
+            self.setText(self._option_name.replace('_', ' ').title())
         
         # Set tooltip with additional information
         self._set_tooltip()
@@ -44,25 +68,12 @@ class OptionsCheckBox(QCheckBox):
     
     def _on_state_changed(self, state: int):
         """Handle state change."""
-        is_checked = state == Qt.CheckState.Checked.value
+        is_checked = state == _CHECKED_VALUE
         self.option_changed.emit(self._option_name, is_checked)
     
     def _set_tooltip(self):
         """Set tooltip based on option type."""
-        tooltips = {
-            'preserve_formatting': 'Maintain cell formatting like bold, italic, colors',
-            'skip_empty_cells': 'Do not translate empty or whitespace-only cells',
-            'skip_formulas': 'Skip cells containing Excel formulas',
-            'skip_headers': 'Skip the first row (typically headers)',
-            'case_sensitive': 'Preserve original text casing in translation',
-            'batch_processing': 'Process multiple cells together for better context',
-            'auto_detect_language': 'Automatically detect source language',
-            'preserve_hyperlinks': 'Maintain clickable links in cells',
-            'backup_original': 'Create backup copy of original file',
-            'show_progress': 'Display detailed progress information',
-        }
-        
-        tooltip = tooltips.get(self._option_name, self._description)
+        tooltip = self._meta[1] if self._meta else self._description
         if tooltip:
             self.setToolTip(tooltip)
     
@@ -91,9 +102,8 @@ class OptionsCheckBox(QCheckBox):
         Args:
             checked: Whether to check the box
         """
-        self.blockSignals(True)
-        self.setChecked(checked)
-        self.blockSignals(False)
+        with QSignalBlocker(self):
+            self.setChecked(checked)
 
 
 class TranslationOptionsGroup(QGroupBox):
@@ -112,13 +122,20 @@ class TranslationOptionsGroup(QGroupBox):
         """
         super().__init__(title, parent)
         self._checkboxes: Dict[str, OptionsCheckBox] = {}
+        
+        # Coalesces bursts of option toggles into one emission per event loop tick
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._emit_options_changed)
+        
         self._setup_ui()
     
     def _setup_ui(self):
         """Set up the UI layout."""
         self.setObjectName("translationOptionsGroup")
-        layout = QVBoxLayout(self)
-        layout.setSpacing(8)
+        self._layout = QVBoxLayout(self)
+        self._layout.setSpacing(8)
         
         # Define default options
         default_options = [
@@ -129,8 +146,16 @@ class TranslationOptionsGroup(QGroupBox):
             ('batch_processing', 'Enable batch processing'),
         ]
         
-        for option_name, description in default_options:
-            self.add_option(option_name, description)
+        # Add all checkboxes with updates suspended, then lay out once
+        self.setUpdatesEnabled(False)
+        self._layout.setEnabled(False)
+        try:
+            for option_name, description in default_options:
+                self.add_option(option_name, description)
+        finally:
+            self._layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+        self._layout.activate()
     
     def add_option(self, option_name: str, description: str, checked: bool = False):
         """
@@ -146,7 +171,7 @@ class TranslationOptionsGroup(QGroupBox):
         checkbox.option_changed.connect(self._on_option_changed)
         
         self._checkboxes[option_name] = checkbox
-        self.layout().addWidget(checkbox)
+        self._layout.addWidget(checkbox)
     
     def remove_option(self, option_name: str):
         """
@@ -157,17 +182,18 @@ class TranslationOptionsGroup(QGroupBox):
         """
         if option_name in self._checkboxes:
             checkbox = self._checkboxes[option_name]
-            self.layout().removeWidget(checkbox)
+            self._layout.removeWidget(checkbox)
             checkbox.deleteLater()
             del self._checkboxes[option_name]
             self._emit_options_changed()
     
     def _on_option_changed(self, option_name: str, checked: bool):
         """Handle individual option change."""
-        self._emit_options_changed()
+        self._emit_timer.start()
     
     def _emit_options_changed(self):
         """Emit signal with all current option states."""
+        self._emit_timer.stop()  # A direct emission supersedes a pending one
         options = self.get_all_options()
         self.options_changed.emit(options)
     
@@ -220,8 +246,9 @@ class TranslationOptionsGroup(QGroupBox):
             options: Dictionary of option states
             silent: Whether to suppress signals
         """
+        # Apply every state silently and notify once with the final result
         for option_name, checked in options.items():
-            self.set_option_state(option_name, checked, silent)
+            self.set_option_state(option_name, checked, silent=True)
         
         if not silent:
             self._emit_options_changed()
@@ -280,6 +307,13 @@ class AdvancedOptionsGroup(QGroupBox):
         """Initialize the advanced options group."""
         super().__init__("Advanced Options", parent)
         self._checkboxes: Dict[str, OptionsCheckBox] = {}
+        
+        # Coalesces bursts of option toggles into one emission per event loop tick
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._emit_advanced_options_changed)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -288,28 +322,44 @@ class AdvancedOptionsGroup(QGroupBox):
         self.setCheckable(True)
         self.setChecked(False)  # Collapsed by default
         
-        layout = QVBoxLayout(self)
-        layout.setSpacing(6)
+        self._layout = QVBoxLayout(self)
+        self._layout.setSpacing(6)
         
-        # Advanced options
-        advanced_options = [
+        # Advanced options, built on first expansion (see _ensure_checkboxes)
+        self._pending_options = [
             ('preserve_hyperlinks', 'Preserve hyperlinks'),
             ('backup_original', 'Create backup copy'),
             ('case_sensitive', 'Case-sensitive translation'),
             ('show_progress', 'Show detailed progress'),
         ]
+        self._pending_states: Dict[str, bool] = {}
+        
+        # Connect group toggle
+        self.toggled.connect(self._on_group_toggled)
+    
+    def _ensure_checkboxes(self):
+        """Create the option checkboxes if they have not been built yet."""
+        if not self._pending_options:
+            return
         
-        for option_name, description in advanced_options:
+        for option_name, description in self._pending_options:
             checkbox = OptionsCheckBox(option_name, description, self)
+            checkbox.set_checked_silent(self._pending_states.get(option_name, False))
             checkbox.option_changed.connect(self._on_option_changed)
             self._checkboxes[option_name] = checkbox
-            layout.addWidget(checkbox)
+            self._layout.addWidget(checkbox)
         
-        # Connect group toggle
-        self.toggled.connect(self._on_group_toggled)
+        self._pending_options = []
+        self._pending_states.clear()
     
     def _on_option_changed(self, option_name: str, checked: bool):
         """Handle individual option change."""
+        if not self.isChecked():
+            return  # Collapsed groups expose no options, so nothing changed
+        self._emit_timer.start()
+    
+    def _emit_advanced_options_changed(self):
+        """Emit signal with all current advanced option states."""
         options = {
             name: checkbox.isChecked()
             for name, checkbox in self._checkboxes.items()
@@ -318,7 +368,10 @@ class AdvancedOptionsGroup(QGroupBox):
     
     def _on_group_toggled(self, checked: bool):
         """Handle group toggle."""
-        # Enable/disable all child checkboxes
+        if checked:
+            self._ensure_checkboxes()
+        
+        # Show/hide all child checkboxes
         for checkbox in self._checkboxes.values():
             checkbox.setVisible(checked)
     
@@ -344,6 +397,14 @@ class AdvancedOptionsGroup(QGroupBox):
         Args:
             options: Dictionary of option states
         """
+        if self._pending_options:
+            # Not built yet: remember known options for when the group expands
+            known = {name for name, _ in self._pending_options}
+            self._pending_states.update(
+                (name, checked) for name, checked in options.items() if name in known
+            )
+            return
+        
         for option_name, checked in options.items():
             checkbox = self._checkboxes.get(option_name)
             if checkbox:
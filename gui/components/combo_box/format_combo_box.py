@@ -4,9 +4,10 @@ Format Options Combo Box Component
 Modern QComboBox implementation for Excel format selection.
 """
 
+import os
 from PyQt6.QtWidgets import QComboBox
-from PyQt6.QtCore import pyqtSignal, Qt
-from typing import Dict, Optional, List
+from PyQt6.QtCore import pyqtSignal, Qt, QSignalBlocker
+from typing import ClassVar, Dict, Optional, List
 from enum import Enum
 
 
@@ -24,10 +25,31 @@ class FormatComboBox(QComboBox):
     # Signals
     format_changed = pyqtSignal(str)  # Emits format extension
     
+    # Lowercase filename extension -> format
+    _EXT_MAP: ClassVar[Dict[str, str]] = {fmt.value: fmt.value for fmt in ExcelFormat}
+    
+    # QFileDialog filters per format
+    _FILE_FILTERS: ClassVar[Dict[str, str]] = {
+        ExcelFormat.XLSX.value: "Excel Workbook (*.xlsx)",
+        ExcelFormat.XLSM.value: "Excel Macro-Enabled (*.xlsm)",
+        ExcelFormat.XLS.value: "Excel 97-2003 (*.xls)",
+        ExcelFormat.CSV.value: "CSV Files (*.csv)",
+    }
+    
+    # MIME types per format
+    _MIME_TYPES: ClassVar[Dict[str, str]] = {
+        ExcelFormat.XLSX.value: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ExcelFormat.XLSM.value: "application/vnd.ms-excel.sheet.macroEnabled.12",
+        ExcelFormat.XLS.value: "application/vnd.ms-excel",
+        ExcelFormat.CSV.value: "text/csv",
+    }
+    
     def __init__(self, parent=None):
         """Initialize the format combo box."""
         super().__init__(parent)
+        self._has_focus = False
         self._format_data: Dict[str, str] = {}
+        self._ext_to_display: Dict[str, str] = {}  # Reverse of _format_data
         self._setup_ui()
         self._connect_signals()
         self._load_formats()
@@ -61,12 +83,15 @@ class FormatComboBox(QComboBox):
             "Comma Separated Values (*.csv)": ExcelFormat.CSV.value,
         }
         
+        self._format_data.update(formats)
         for display_name, extension in formats.items():
-            self.addItem(display_name)
-            self._format_data[display_name] = extension
+            self._ext_to_display.setdefault(extension, display_name)
         
-        # Set default to XLSX
-        self.setCurrentText("Excel Workbook (*.xlsx)")
+        # Populate in one call and default to XLSX (first entry) without
+        # emitting format_changed before anyone is connected
+        with QSignalBlocker(self):
+            self.addItems(list(formats))
+            self.setCurrentIndex(0)
     
     def set_format(self, format_extension: str):
         """
@@ -75,10 +100,9 @@ class FormatComboBox(QComboBox):
         Args:
             format_extension: The format extension to select
         """
-        for display_name, ext in self._format_data.items():
-            if ext == format_extension:
-                self.setCurrentText(display_name)
-                break
+        display_name = self._ext_to_display.get(format_extension)
+        if display_name:
+            self.setCurrentText(display_name)
     
     def get_selected_format(self) -> Optional[str]:
         """
@@ -106,16 +130,7 @@ class FormatComboBox(QComboBox):
         Returns:
             File filter string for QFileDialog
         """
-        current_format = self.get_selected_format()
-        
-        filters = {
-            ExcelFormat.XLSX.value: "Excel Workbook (*.xlsx)",
-            ExcelFormat.XLSM.value: "Excel Macro-Enabled (*.xlsm)",
-            ExcelFormat.XLS.value: "Excel 97-2003 (*.xls)",
-            ExcelFormat.CSV.value: "CSV Files (*.csv)",
-        }
-        
-        return filters.get(current_format, "All Files (*)")
+        return self._FILE_FILTERS.get(self.get_selected_format(), "All Files (*)")
     
     def is_excel_format(self) -> bool:
         """
@@ -152,20 +167,21 @@ class FormatComboBox(QComboBox):
         Returns:
             MIME type string
         """
-        current_format = self.get_selected_format()
-        
-        mime_types = {
-            ExcelFormat.XLSX.value: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            ExcelFormat.XLSM.value: "application/vnd.ms-excel.sheet.macroEnabled.12",
-            ExcelFormat.XLS.value: "application/vnd.ms-excel",
-            ExcelFormat.CSV.value: "text/csv",
-        }
-        
-        return mime_types.get(current_format, "application/octet-stream")
+        return self._MIME_TYPES.get(self.get_selected_format(), "application/octet-stream")
+    
+    def focusInEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = True
+        super().focusInEvent(event)
+    
+    def focusOutEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = False
+        super().focusOutEvent(event)
     
     def wheelEvent(self, event):
         """Override wheel event to prevent accidental changes."""
-        if self.hasFocus():
+        if self._has_focus:
             super().wheelEvent(event)
         else:
             event.ignore()
@@ -189,19 +205,10 @@ class FormatComboBox(QComboBox):
         if not filename:
             return
             
-        filename_lower = filename.lower()
+        ext = os.path.splitext(filename)[1][1:].lower()
         
-        if filename_lower.endswith('.xlsx'):
-            self.set_format(ExcelFormat.XLSX.value)
-        elif filename_lower.endswith('.xlsm'):
-            self.set_format(ExcelFormat.XLSM.value)
-        elif filename_lower.endswith('.xls'):
-            self.set_format(ExcelFormat.XLS.value)
-        elif filename_lower.endswith('.csv'):
-            self.set_format(ExcelFormat.CSV.value)
-        else:
-            # Default to XLSX for unknown extensions
-            self.set_format(ExcelFormat.XLSX.value)
+        # Default to XLSX for unknown extensions
+        self.set_format(self._EXT_MAP.get(ext, ExcelFormat.XLSX.value))
     
     def get_recommended_extension(self) -> str:
         """
@@ -4,9 +4,12 @@ Source Language Combo Box Component
 Modern QComboBox implementation for source language selection.
 """
 
+import sys
 from PyQt6.QtWidgets import QComboBox
-from PyQt6.QtCore import pyqtSignal, Qt
-from typing import Dict, Optional, List
+from PyQt6.QtCore import pyqtSignal, Qt, QSignalBlocker, QStringListModel
+from typing import Dict, Optional, Tuple
+
+from .utils import sorted_language_items
 
 
 class SourceLanguageComboBox(QComboBox):
@@ -18,7 +21,10 @@ class SourceLanguageComboBox(QComboBox):
     def __init__(self, parent=None):
         """Initialize the source language combo box."""
         super().__init__(parent)
-        self._language_codes: Dict[str, str] = {}
+        self._has_focus = False
+        self._language_codes: Dict[str, str] = {}  # Display name -> code
+        self._code_to_name: Dict[str, str] = {}  # Code -> display name
+        self._code_list_cache: Optional[Tuple[str, ...]] = None  # Built by get_language_list
         self._setup_ui()
         self._connect_signals()
     
@@ -29,6 +35,10 @@ class SourceLanguageComboBox(QComboBox):
         self.setEditable(False)
         self.setMaxVisibleItems(10)
         
+        # Plain string model: one QString per row instead of a QStandardItem
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        
         # Set initial state
         self.setCurrentIndex(-1)
         
@@ -52,15 +62,21 @@ class SourceLanguageComboBox(QComboBox):
         Args:
             languages: Dict mapping language codes to display names
         """
-        self.clear()
-        self._language_codes.clear()
-        
         # Sort languages by display name
-        sorted_languages = sorted(languages.items(), key=lambda x: x[1])
+        sorted_languages = sorted_language_items(tuple(languages.items()))
         
-        for code, name in sorted_languages:
-            self.addItem(name)
-            self._language_codes[name] = code
+        # Interned so dict lookups can match on identity first
+        self._code_to_name = {
+            sys.intern(code): sys.intern(name) for code, name in sorted_languages
+        }
+        self._language_codes = {name: code for code, name in self._code_to_name.items()}
+        self._code_list_cache = None
+        
+        # Repopulate in one batch; selection changes during a reload are not
+        # user choices, so language_changed stays quiet
+        with QSignalBlocker(self):
+            self._model.setStringList(list(self._code_to_name.values()))
+            self.setCurrentIndex(0 if self._code_to_name else -1)
     
     def set_language(self, language_code: str):
         """
@@ -69,10 +85,9 @@ class SourceLanguageComboBox(QComboBox):
         Args:
             language_code: The language code to select
         """
-        for name, code in self._language_codes.items():
-            if code == language_code:
-                self.setCurrentText(name)
-                break
+        name = self._code_to_name.get(language_code)
+        if name:
+            self.setCurrentText(name)
     
     def get_selected_language(self) -> Optional[str]:
         """
@@ -97,6 +112,8 @@ class SourceLanguageComboBox(QComboBox):
         """Add auto-detect option to the combo box."""
         self.insertItem(0, "Auto-detect")
         self._language_codes["Auto-detect"] = "auto"
+        self._code_to_name["auto"] = "Auto-detect"
+        self._code_list_cache = None
         self.setCurrentIndex(0)
     
     def set_placeholder_text(self, text: str):
@@ -107,13 +124,24 @@ class SourceLanguageComboBox(QComboBox):
             text: The placeholder text
         """
         if self.count() == 0 or not self.currentText():
-            self.addItem(text)
-            self.setCurrentIndex(0)
-            self.setItemData(0, False, Qt.ItemDataRole.UserRole)
+            # The placeholder is not a language choice, so nothing is signalled
+            with QSignalBlocker(self):
+                self.addItem(text)
+                self.setCurrentIndex(0)
+    
+    def focusInEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = True
+        super().focusInEvent(event)
+    
+    def focusOutEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = False
+        super().focusOutEvent(event)
     
     def wheelEvent(self, event):
         """Override wheel event to prevent accidental changes."""
-        if self.hasFocus():
+        if self._has_focus:
             super().wheelEvent(event)
         else:
             event.ignore()
@@ -127,14 +155,16 @@ class SourceLanguageComboBox(QComboBox):
         """
         return bool(self.get_selected_language())
     
-    def get_language_list(self) -> List[str]:
+    def get_language_list(self) -> Tuple[str, ...]:
         """
-        Get list of available language codes.
+        Get the available language codes.
         
         Returns:
-            List of language codes
+            Tuple of language codes, shared between calls
         """
-        return list(self._language_codes.values())
+        if self._code_list_cache is None:
+            self._code_list_cache = tuple(self._language_codes.values())
+        return self._code_list_cache
     
     def clear_selection(self):
         """Clear the current selection."""
@@ -4,9 +4,15 @@ Target Language Combo Box Component
 Modern QComboBox implementation for target language selection.
 """
 
+import sys
 from PyQt6.QtWidgets import QComboBox
-from PyQt6.QtCore import pyqtSignal, Qt
-from typing import Dict, Optional, List
+from PyQt6.QtCore import pyqtSignal, Qt, QSignalBlocker, QStringListModel
+from typing import Dict, FrozenSet, Optional, List, Tuple
+
+from .utils import sorted_language_items
+
+# Popular language codes for quick access, in display order
+POPULAR_CODES = ('en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh')
 
 
 class TargetLanguageComboBox(QComboBox):
@@ -18,8 +24,13 @@ class TargetLanguageComboBox(QComboBox):
     def __init__(self, parent=None):
         """Initialize the target language combo box."""
         super().__init__(parent)
-        self._language_codes: Dict[str, str] = {}
-        self._excluded_codes: List[str] = []
+        self._has_focus = False
+        self._language_codes: Dict[str, str] = {}  # Display name -> code
+        self._code_to_name: Dict[str, str] = {}  # Code -> display name
+        self._code_list_cache: Optional[Tuple[str, ...]] = None  # Built by get_language_list
+        self._code_to_index: Dict[str, int] = {}  # Code -> item row
+        self._recommended_code: Optional[str] = None
+        self._excluded_codes: FrozenSet[str] = frozenset()
         self._setup_ui()
         self._connect_signals()
     
@@ -30,6 +41,10 @@ class TargetLanguageComboBox(QComboBox):
         self.setEditable(False)
         self.setMaxVisibleItems(10)
         
+        # Plain string model: one QString per row instead of a QStandardItem
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        
         # Set initial state
         self.setCurrentIndex(-1)
         
@@ -53,21 +68,26 @@ class TargetLanguageComboBox(QComboBox):
         Args:
             languages: Dict mapping language codes to display names
         """
-        self.clear()
-        self._language_codes.clear()
+        # Sort languages by display name, then filter out excluded languages
+        # so the cached sort is shared with the source combo box
+        sorted_languages = [
+            item for item in sorted_language_items(tuple(languages.items()))
+            if item[0] not in self._excluded_codes
+        ]
         
-        # Filter out excluded languages
-        filtered_languages = {
-            code: name for code, name in languages.items()
-            if code not in self._excluded_codes
+        # Interned so dict lookups can match on identity first
+        self._code_to_name = {
+            sys.intern(code): sys.intern(name) for code, name in sorted_languages
         }
+        self._language_codes = {name: code for code, name in self._code_to_name.items()}
+        self._code_list_cache = None
+        self._code_to_index = {code: row for row, code in enumerate(self._code_to_name)}
         
-        # Sort languages by display name
-        sorted_languages = sorted(filtered_languages.items(), key=lambda x: x[1])
-        
-        for code, name in sorted_languages:
-            self.addItem(name)
-            self._language_codes[name] = code
+        # Repopulate in one batch; selection changes during a reload are not
+        # user choices, so language_changed stays quiet
+        with QSignalBlocker(self):
+            self._model.setStringList(list(self._code_to_name.values()))
+            self.setCurrentIndex(0 if self._code_to_name else -1)
     
     def set_language(self, language_code: str):
         """
@@ -76,10 +96,9 @@ class TargetLanguageComboBox(QComboBox):
         Args:
             language_code: The language code to select
         """
-        for name, code in self._language_codes.items():
-            if code == language_code:
-                self.setCurrentText(name)
-                break
+        name = self._code_to_name.get(language_code)
+        if name:
+            self.setCurrentText(name)
     
     def get_selected_language(self) -> Optional[str]:
         """
@@ -107,16 +126,49 @@ class TargetLanguageComboBox(QComboBox):
         Args:
             language_codes: List of language codes to exclude
         """
-        self._excluded_codes = language_codes
+        self._excluded_codes = frozenset(sys.intern(code) for code in language_codes)
         
-        # Remove excluded languages from current items
-        for i in range(self.count() - 1, -1, -1):
+        # Split current items into survivors and excluded languages
+        excluded_rows = []
+        survivors = []
+        for i in range(self.count()):
             item_text = self.itemText(i)
-            if item_text in self._language_codes:
-                code = self._language_codes[item_text]
-                if code in self._excluded_codes:
-                    self.removeItem(i)
-                    del self._language_codes[item_text]
+            code = self._language_codes.get(item_text)
+            if code is not None and code in self._excluded_codes:
+                excluded_rows.append(i)
+                del self._language_codes[item_text]
+                self._code_to_name.pop(code, None)
+            else:
+                survivors.append(i)
+        
+        if not excluded_rows:
+            return
+        self._code_list_cache = None
+        
+        # Keep the current item, or fall to the next survivor like removeItem does
+        current = self.currentIndex()
+        new_index = -1
+        if current >= 0 and survivors:
+            new_index = next(
+                (n for n, i in enumerate(survivors) if i >= current), len(survivors) - 1
+            )
+        selection_kept = current in survivors
+        
+        # Replace the string list once instead of removing rows one at a time
+        items = [self.itemText(i) for i in survivors]
+        with QSignalBlocker(self):
+            self._model.setStringList(items)
+            self.setCurrentIndex(new_index if selection_kept else -1)
+        
+        self._code_to_index = {}
+        for row, text in enumerate(items):
+            code = self._language_codes.get(text)
+            if code is not None:
+                self._code_to_index[code] = row
+        
+        if not selection_kept:
+            # The selected language was excluded: notify once for the new selection
+            self.setCurrentIndex(new_index)
     
     def set_placeholder_text(self, text: str):
         """
@@ -126,13 +178,24 @@ class TargetLanguageComboBox(QComboBox):
             text: The placeholder text
         """
         if self.count() == 0 or not self.currentText():
-            self.addItem(text)
-            self.setCurrentIndex(0)
-            self.setItemData(0, False, Qt.ItemDataRole.UserRole)
+            # The placeholder is not a language choice, so nothing is signalled
+            with QSignalBlocker(self):
+                self.addItem(text)
+                self.setCurrentIndex(0)
+    
+    def focusInEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = True
+        super().focusInEvent(event)
+    
+    def focusOutEvent(self, event):
+        """Track focus so wheelEvent need not query it."""
+        self._has_focus = False
+        super().focusOutEvent(event)
     
     def wheelEvent(self, event):
         """Override wheel event to prevent accidental changes."""
-        if self.hasFocus():
+        if self._has_focus:
             super().wheelEvent(event)
         else:
             event.ignore()
@@ -146,14 +209,16 @@ class TargetLanguageComboBox(QComboBox):
         """
         return bool(self.get_selected_language())
     
-    def get_language_list(self) -> List[str]:
+    def get_language_list(self) -> Tuple[str, ...]:
         """
-        Get list of available language codes.
+        Get the available language codes.
         
         Returns:
-            List of language codes
+            Tuple of language codes, shared between calls
         """
-        return list(self._language_codes.values())
+        if self._code_list_cache is None:
+            self._code_list_cache = tuple(self._language_codes.values())
+        return self._code_list_cache
     
     def clear_selection(self):
         """Clear the current selection."""
@@ -179,8 +244,7 @@ class TargetLanguageComboBox(QComboBox):
         Returns:
             List of popular language codes
         """
-        popular = ['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh']
-        return [code for code in popular if code in self.get_language_list()]
+        return [code for code in POPULAR_CODES if code in self._code_to_name]
     
     def set_recommended_language(self, language_code: str):
         """
@@ -189,12 +253,19 @@ class TargetLanguageComboBox(QComboBox):
         Args:
             language_code: The recommended language code
         """
-        for name, code in self._language_codes.items():
-            if code == language_code:
-                # Find the item index
-                index = self.findText(name)
-                if index >= 0:
-                    # Add visual indication (could be styled with CSS)
-                    self.setItemData(index, "recommended", Qt.ItemDataRole.UserRole + 1)
-                    self.setCurrentIndex(index)
-                break
+        index = self._code_to_index.get(language_code)
+        if index is not None:
+            # Kept on the widget: the string list model holds no per-item roles
+            self._recommended_code = language_code
+            self.setCurrentIndex(index)
+    
+    def get_recommended_language(self) -> Optional[str]:
+        """
+        Get the language last set as recommended.
+        
+        Returns:
+            The recommended language code, or None if it is not available
+        """
+        if self._recommended_code in self._code_to_name:
+            return self._recommended_code
+        return None
@@ -0,0 +1,26 @@
+"""
+Combo Box Utilities
+
+Helpers shared by the language combo box components.
+"""
+
+import functools
+from operator import itemgetter
+from typing import Tuple
+
+
+@functools.lru_cache(maxsize=4)
+def sorted_language_items(language_items: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Sort (code, name) language pairs by display name.
+    
+    Cached so the source and target combo boxes, and repeated reloads,
+    share one sort of the same language set.
+    
+    Args:
+        language_items: Tuple of (code, display name) pairs
+        
+    Returns:
+        Tuple of (code, display name) pairs sorted by display name
+    """
+    return tuple(sorted(language_items, key=itemgetter(1)))
@@ -6,9 +6,95 @@ Modern drag and drop widget for file selection.
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
 from PyQt6.QtCore import pyqtSignal, Qt, QMimeData, QUrl
-from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QPainter, QPen, QBrush, QColor
-from typing import List, Optional
+from PyQt6.QtGui import QDragEnterEvent, QDropEvent
+from typing import Dict, List, Optional, Tuple
 import os
+import sys
+
+
+# Accepted extensions by default, already lowercase
+_DEFAULT_EXTS = ('.xlsx', '.xlsm', '.xls', '.csv')
+_FORMATS_LABEL_DEFAULT = f"Supported: {', '.join(_DEFAULT_EXTS)}"
+
+# Drop zone stylesheets, one per visual state
+
+# Inactive (processing in progress)
+_QSS_INACTIVE = """
+QFrame#fileDropZone {
+    border: 2px dashed #cccccc;
+    border-radius: 8px;
+    background-color: #f8f9fa;
+}
+"""
+
+# File dragged over the zone
+_QSS_HOVER = """
+QFrame#fileDropZone {
+    border: 2px dashed #007bff;
+    border-radius: 8px;
+    background-color: #e7f3ff;
+}
+QLabel#dropMainLabel {
+    color: #007bff;
+    font-weight: bold;
+}
+"""
+
+# Idle, waiting for files
+_QSS_IDLE = """
+QFrame#fileDropZone {
+    border: 2px dashed #6c757d;
+    border-radius: 8px;
+    background-color: #ffffff;
+}
+QFrame#fileDropZone:hover {
+    border-color: #007bff;
+    background-color: #f8f9fa;
+}
+QLabel#dropMainLabel {
+    color: #495057;
+    font-size: 14px;
+    font-weight: bold;
+}
+QLabel#dropSubtitleLabel {
+    color: #6c757d;
+    font-size: 12px;
+}
+QLabel#dropFormatsLabel {
+    color: #868e96;
+    font-size: 10px;
+}
+"""
+
+# Error state
+_QSS_ERROR = """
+QFrame#fileDropZone {
+    border: 2px dashed #dc3545;
+    border-radius: 8px;
+    background-color: #f8d7da;
+}
+QLabel#dropMainLabel {
+    color: #721c24;
+}
+QLabel#dropSubtitleLabel {
+    color: #721c24;
+}
+"""
+
+# Success state
+_QSS_SUCCESS = """
+QFrame#fileDropZone {
+    border: 2px dashed #28a745;
+    border-radius: 8px;
+    background-color: #d1eddd;
+}
+QLabel#dropMainLabel {
+    color: #155724;
+}
+QLabel#dropSubtitleLabel {
+    color: #155724;
+}
+"""
 
 
 class FileDropZone(QFrame):
@@ -21,9 +107,12 @@ class FileDropZone(QFrame):
     def __init__(self, parent=None):
         """Initialize the file drop zone."""
         super().__init__(parent)
-        self._accepted_extensions = ['.xlsx', '.xlsm', '.xls', '.csv']
+        self._accepted_extensions = list(_DEFAULT_EXTS)
+        self._ext_tuple = _DEFAULT_EXTS
+        self._ext_tail = max(map(len, _DEFAULT_EXTS))
         self._is_hovering = False
         self._is_active = True
+        self._current_qss: Optional[str] = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -55,8 +144,7 @@ class FileDropZone(QFrame):
         self.subtitle_label.setObjectName("dropSubtitleLabel")
         
         # Supported formats label
-        formats_text = f"Supported: {', '.join(self._accepted_extensions)}"
-        self.formats_label = QLabel(formats_text)
+        self.formats_label = QLabel(_FORMATS_LABEL_DEFAULT)
         self.formats_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.formats_label.setObjectName("dropFormatsLabel")
         
@@ -70,52 +158,19 @@ class FileDropZone(QFrame):
     def _update_appearance(self):
         """Update visual appearance based on state."""
         if not self._is_active:
-            self.setStyleSheet("""
-                QFrame#fileDropZone {
-                    border: 2px dashed #cccccc;
-                    border-radius: 8px;
-                    background-color: #f8f9fa;
-                }
-            """)
+            self._apply_style(_QSS_INACTIVE)
             return
             
         if self._is_hovering:
-            self.setStyleSheet("""
-                QFrame#fileDropZone {
-                    border: 2px dashed #007bff;
-                    border-radius: 8px;
-                    background-color: #e7f3ff;
-                }
-                QLabel#dropMainLabel {
-                    color: #007bff;
-                    font-weight: bold;
-                }
-            """)
+            self._apply_style(_QSS_HOVER)
         else:
-            self.setStyleSheet("""
-                QFrame#fileDropZone {
-                    border: 2px dashed #6c757d;
-                    border-radius: 8px;
-                    background-color: #ffffff;
-                }
-                QFrame#fileDropZone:hover {
-                    border-color: #007bff;
-                    background-color: #f8f9fa;
-                }
-                QLabel#dropMainLabel {
-                    color: #495057;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QLabel#dropSubtitleLabel {
-                    color: #6c757d;
-                    font-size: 12px;
-                }
-                QLabel#dropFormatsLabel {
-                    color: #868e96;
-                    font-size: 10px;
-                }
-            """)
+            self._apply_style(_QSS_IDLE)
+    
+    def _apply_style(self, qss: str):
+        """Apply a state stylesheet unless it is already the active one."""
+        if qss is not self._current_qss:
+            self._current_qss = qss
+            self.setStyleSheet(qss)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
@@ -145,7 +200,7 @@ class FileDropZone(QFrame):
             return
             
         files = self._extract_file_paths(event.mimeData())
-        valid_files = [f for f in files if self._is_valid_file(f)]
+        valid_files = self._filter_valid_files(files)
         
         if valid_files:
             event.acceptProposedAction()
@@ -175,13 +230,18 @@ class FileDropZone(QFrame):
         """
         if not mime_data.hasUrls():
             return False
-            
-        files = self._extract_file_paths(mime_data)
-        return any(self._is_valid_file(f) for f in files)
+        
+        # Stop at the first acceptable file instead of checking every URL
+        for url in mime_data.urls():
+            if url.isLocalFile() and self._is_valid_file(url.toLocalFile()):
+                return True
+        return False
     
     def _extract_file_paths(self, mime_data: QMimeData) -> List[str]:
         """
-        Extract file paths from mime data.
+        Extract local file paths from mime data.
+        
+        Paths are not checked against the filesystem here; see _is_valid_file.
         
         Args:
             mime_data: The mime data containing URLs
@@ -189,13 +249,7 @@ class FileDropZone(QFrame):
         Returns:
             List of file paths
         """
-        files = []
-        for url in mime_data.urls():
-            if url.isLocalFile():
-                file_path = url.toLocalFile()
-                if os.path.isfile(file_path):
-                    files.append(file_path)
-        return files
+        return [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
     
     def _is_valid_file(self, file_path: str) -> bool:
         """
@@ -207,11 +261,56 @@ class FileDropZone(QFrame):
         Returns:
             True if file is valid
         """
-        if not os.path.isfile(file_path):
-            return False
+        # Extension first so unsupported files are rejected without a stat
+        # Only the tail that can hold an extension is lowercased, not the whole path
+        tail = file_path[-self._ext_tail:].lower()
+        return tail.endswith(self._ext_tuple) and os.path.isfile(file_path)
+    
+    def _filter_valid_files(self, file_paths: List[str]) -> List[str]:
+        """
+        Keep the valid files from a drop, preserving order.
+        
+        Files sharing a directory are checked against one os.scandir listing
+        instead of one stat each, which matters on network shares.
+        
+        Args:
+            file_paths: Paths to check
             
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in self._accepted_extensions
+        Returns:
+            List of valid file paths
+        """
+        candidates = [
+            path for path in file_paths
+            if path[-self._ext_tail:].lower().endswith(self._ext_tuple)
+        ]
+        
+        by_dir: Dict[str, List[str]] = {}
+        for path in candidates:
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+        
+        existing = set()
+        for directory, paths in by_dir.items():
+            if len(paths) > 1:
+                try:
+                    with os.scandir(directory or '.') as entries:
+                        files_in_dir = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    files_in_dir = set()
+                existing.update(
+                    path for path in paths if os.path.basename(path) in files_in_dir
+                )
+        
+        # Single files, unreadable directories and names the listing did not
+        # match (e.g. differing case on Windows) fall back to a plain stat
+        return [
+            path for path in candidates
+            if path in existing or os.path.isfile(path)
+        ]
+    
+    @staticmethod
+    def _build_extension_tuple(extensions: List[str]) -> Tuple[str, ...]:
+        """Build the lowercase extension tuple used for suffix tests."""
+        return tuple(sys.intern(ext.lower()) for ext in extensions)
     
     def set_accepted_extensions(self, extensions: List[str]):
         """
@@ -221,6 +320,8 @@ class FileDropZone(QFrame):
             extensions: List of accepted extensions (with dots)
         """
         self._accepted_extensions = extensions
+        self._ext_tuple = self._build_extension_tuple(extensions)
+        self._ext_tail = max(map(len, self._ext_tuple), default=0)
         formats_text = f"Supported: {', '.join(extensions)}"
         self.formats_label.setText(formats_text)
     
@@ -269,19 +370,7 @@ class FileDropZone(QFrame):
         """
         self.main_label.setText("❌ Error")
         self.subtitle_label.setText(error_message)
-        self.setStyleSheet("""
-            QFrame#fileDropZone {
-                border: 2px dashed #dc3545;
-                border-radius: 8px;
-                background-color: #f8d7da;
-            }
-            QLabel#dropMainLabel {
-                color: #721c24;
-            }
-            QLabel#dropSubtitleLabel {
-                color: #721c24;
-            }
-        """)
+        self._apply_style(_QSS_ERROR)
     
     def show_success(self, file_name: str):
         """
@@ -292,19 +381,7 @@ class FileDropZone(QFrame):
         """
         self.main_label.setText("✅ File loaded")
         self.subtitle_label.setText(f"{os.path.basename(file_name)}")
-        self.setStyleSheet("""
-            QFrame#fileDropZone {
-                border: 2px dashed #28a745;
-                border-radius: 8px;
-                background-color: #d1eddd;
-            }
-            QLabel#dropMainLabel {
-                color: #155724;
-            }
-            QLabel#dropSubtitleLabel {
-                color: #155724;
-            }
-        """)
+        self._apply_style(_QSS_SUCCESS)
     
     def get_accepted_extensions(self) -> List[str]:
         """
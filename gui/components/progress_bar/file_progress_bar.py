@@ -4,11 +4,22 @@ File Operation Progress Bar Component
 Modern QProgressBar implementation for file operations.
 """
 
-from PyQt6.QtWidgets import QProgressBar, QWidget, QVBoxLayout, QLabel
+from PyQt6.QtWidgets import QProgressBar, QWidget, QVBoxLayout
 from PyQt6.QtCore import pyqtSignal, QTimer, Qt
-from PyQt6.QtGui import QMovie
 from typing import Optional
 from enum import Enum
+import time
+
+from .utils import batched_updates
+
+# Repaint at least this often while progress keeps arriving, even in small steps
+_MIN_UPDATE_INTERVAL_NS = 50_000_000
+
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+
+# QProgressBar ranges are C ints; larger files are mapped onto a fixed range
+_MAX_BYTE_RANGE = 2_000_000_000
+_SCALED_MAXIMUM = 10000
 
 
 class FileOperationType(Enum):
@@ -20,10 +31,17 @@ class FileOperationType(Enum):
     EXPORTING = "exporting"
 
 
+# Display label per operation
+_OP_LABEL = {op: op.value.capitalize() for op in FileOperationType}
+
+
 class FileProgressBar(QProgressBar):
     """Custom progress bar for file operations with modern styling."""
     
-    # Signals
+    # Signals, emitted on the GUI thread only, so receivers can connect with
+    # Qt.ConnectionType.DirectConnection. Worker threads must not call
+    # update_file_progress directly; they emit their own signal, which Qt
+    # queues here.
     operation_completed = pyqtSignal(str)  # Emits operation type
     operation_failed = pyqtSignal(str, str)  # Emits operation type and error
     
@@ -33,6 +51,14 @@ class FileProgressBar(QProgressBar):
         self._setup_ui()
         self._current_operation: Optional[FileOperationType] = None
         self._file_name = ""
+        self._update_step = 1  # Bytes between visible updates
+        self._last_emitted_value = 0
+        self._last_emit_ns = 0
+        self._op_name = "Processing"  # Verb shown in byte-based formats
+        self._mb_total_str = "0.0"  # File size in MB, formatted once per operation
+        self._byte_total = 100  # Progress total in bytes (or 100 without a size)
+        self._progress_scale = 1  # Bytes per progress bar unit
+        self._status_message = ""  # Status text shown instead of the operation label
     
     def _setup_ui(self):
         """Set up the UI components."""
@@ -44,6 +70,22 @@ class FileProgressBar(QProgressBar):
         
         # Set initial state
         self.setVisible(False)
+        
+        # One reusable timer for the delayed hide after completion/cancellation
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide_progress)
+    
+    def _set_state(self, state: str):
+        """Update the state property, repolishing only when it changes."""
+        if self.property("state") == state:
+            return
+        
+        # Chunk colours per state live in gui/styles/progress_bars.qss
+        self.setProperty("state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
     
     def start_file_operation(self, operation: FileOperationType, file_name: str = "", file_size: int = 0):
         """
@@ -54,45 +96,34 @@ class FileProgressBar(QProgressBar):
             file_name: Name of the file being processed
             file_size: Size of the file in bytes (for progress calculation)
         """
+        self._hide_timer.stop()  # A pending hide belongs to the previous operation
         self._current_operation = operation
         self._file_name = file_name
+        self._status_message = ""
         
-        # Set operation-specific settings
-        operation_configs = {
-            FileOperationType.LOADING: {
-                "format": f"Loading {file_name}... %p%",
-                "style": "background-color: #007bff;"
-            },
-            FileOperationType.SAVING: {
-                "format": f"Saving {file_name}... %p%",
-                "style": "background-color: #28a745;"
-            },
-            FileOperationType.PROCESSING: {
-                "format": f"Processing {file_name}... %p%",
-                "style": "background-color: #ffc107;"
-            },
-            FileOperationType.VALIDATING: {
-                "format": f"Validating {file_name}... %p%",
-                "style": "background-color: #17a2b8;"
-            },
-            FileOperationType.EXPORTING: {
-                "format": f"Exporting {file_name}... %p%",
-                "style": "background-color: #6f42c1;"
-            }
-        }
-        
-        config = operation_configs.get(operation, operation_configs[FileOperationType.PROCESSING])
-        
-        self.setFormat(config["format"])
-        self.setStyleSheet(f"QProgressBar::chunk {{ {config['style']} }}")
-        
-        if file_size > 0:
-            self.setMaximum(file_size)
-        else:
-            self.setMaximum(100)
-        
-        self.setValue(0)
-        self.setVisible(True)
+        with batched_updates(self):
+            # Set operation-specific settings
+            self._op_name = _OP_LABEL.get(operation, "Processing")
+            self.setFormat(f"{self._op_name} {file_name}... %p%")
+            self._set_state(operation.value)
+            
+            self._byte_total = file_size if file_size > 0 else 100
+            if self._byte_total > _MAX_BYTE_RANGE:
+                self._progress_scale = self._byte_total / _SCALED_MAXIMUM
+                self.setMaximum(_SCALED_MAXIMUM)
+            else:
+                self._progress_scale = 1
+                self.setMaximum(self._byte_total)
+            
+            self._mb_total_str = f"{self._byte_total * _BYTES_TO_MB:.1f}"
+            
+            # Repaint roughly every 0.5% of the file
+            self._update_step = max(1, file_size // 200)
+            self._last_emitted_value = 0
+            self._last_emit_ns = 0
+            
+            self.setValue(0)
+            self.setVisible(True)
     
     def update_file_progress(self, bytes_processed: int):
         """
@@ -101,15 +132,38 @@ class FileProgressBar(QProgressBar):
         Args:
             bytes_processed: Number of bytes processed
         """
-        self.setValue(bytes_processed)
+        # Coalesce small steps; the final value is always shown
+        now = time.monotonic_ns()
+        if (bytes_processed < self._byte_total
+                and abs(bytes_processed - self._last_emitted_value) < self._update_step
+                and now - self._last_emit_ns < _MIN_UPDATE_INTERVAL_NS):
+            return
+        self._last_emitted_value = bytes_processed
+        self._last_emit_ns = now
+        
+        if self._progress_scale == 1:
+            self.setValue(bytes_processed)
+        else:
+            self.setValue(int(bytes_processed / self._progress_scale))
         
         # Update format with file size info if available
         if self.maximum() > 100:  # Assuming byte-based progress
-            mb_processed = bytes_processed / (1024 * 1024)
-            mb_total = self.maximum() / (1024 * 1024)
-            
-            operation_name = self._current_operation.value.capitalize() if self._current_operation else "Processing"
-            self.setFormat(f"{operation_name} {self._file_name}... {mb_processed:.1f}/{mb_total:.1f} MB")
+            mb_processed = bytes_processed * _BYTES_TO_MB
+            label = self._status_message or f"{self._op_name} {self._file_name}..."
+            self.setFormat(f"{label} {mb_processed:.1f}/{self._mb_total_str} MB")
+    
+    def set_status_message(self, message: str):
+        """
+        Show a status message in place of the operation label.
+        
+        The message is kept until the next operation starts, so later
+        progress updates show it alongside the byte counts.
+        
+        Args:
+            message: Status message to display
+        """
+        self._status_message = message
+        self.setFormat(f"{message} %p%")
     
     def set_indeterminate(self, message: str = ""):
         """
@@ -124,7 +178,7 @@ class FileProgressBar(QProgressBar):
         if message:
             self.setFormat(message)
         elif self._current_operation:
-            operation_name = self._current_operation.value.capitalize()
+            operation_name = _OP_LABEL[self._current_operation]
             self.setFormat(f"{operation_name} {self._file_name}...")
     
     def complete_operation(self, success: bool = True, message: str = ""):
@@ -145,21 +199,17 @@ class FileProgressBar(QProgressBar):
                 self.operation_failed.emit(self._current_operation.value, message)
         
         # Hide after delay
-        QTimer.singleShot(1500, self.hide_progress)
+        self._hide_timer.start(1500)
     
     def _set_success_state(self, message: str = ""):
         """Set progress bar to success state."""
         if message:
             self.setFormat(message)
         elif self._current_operation:
-            operation_name = self._current_operation.value.capitalize()
+            operation_name = _OP_LABEL[self._current_operation]
             self.setFormat(f"{operation_name} completed successfully")
         
-        self.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #28a745;
-            }
-        """)
+        self._set_state("success")
         self.setValue(self.maximum())
     
     def _set_error_state(self, message: str = ""):
@@ -169,21 +219,23 @@ class FileProgressBar(QProgressBar):
         else:
             self.setFormat("Operation failed")
         
-        self.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #dc3545;
-            }
-        """)
+        self._set_state("error")
     
     def hide_progress(self):
         """Hide the progress bar and reset state."""
-        self.setVisible(False)
-        self.setValue(0)
-        self.setMinimum(0)
-        self.setMaximum(100)
+        self._hide_timer.stop()
+        with batched_updates(self):
+            self.setVisible(False)
+            self.setValue(0)
+            self.setMinimum(0)
+            self.setMaximum(100)
+            self._set_state("")
         self._current_operation = None
         self._file_name = ""
-        self.setStyleSheet("")
+        self._status_message = ""
+        self._op_name = "Processing"
+        self._byte_total = 100
+        self._progress_scale = 1
     
     def get_current_operation(self) -> Optional[FileOperationType]:
         """
@@ -215,18 +267,14 @@ class FileProgressBar(QProgressBar):
     def cancel_operation(self):
         """Cancel the current operation."""
         if self._current_operation:
-            operation_name = self._current_operation.value.capitalize()
+            operation_name = _OP_LABEL[self._current_operation]
             self.setFormat(f"{operation_name} cancelled")
-            self.setStyleSheet("""
-                QProgressBar::chunk {
-                    background-color: #6c757d;
-                }
-            """)
-            QTimer.singleShot(1000, self.hide_progress)
+            self._set_state("cancelled")
+            self._hide_timer.start(1000)
 
 
 class FileProgressWidget(QWidget):
-    """Widget containing file progress bar with status label."""
+    """Container for a file progress bar; status text is shown in the bar itself."""
     
     def __init__(self, parent=None):
         """Initialize the file progress widget."""
@@ -237,23 +285,11 @@ class FileProgressWidget(QWidget):
         """Set up the UI layout."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(3)
-        
-        # Status label
-        self.status_label = QLabel()
-        self.status_label.setObjectName("fileStatusLabel")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        # Progress bar
+        # Progress bar; completion and failure text come from its own format
         self.progress_bar = FileProgressBar()
-        
-        layout.addWidget(self.status_label)
         layout.addWidget(self.progress_bar)
         
-        # Connect signals
-        self.progress_bar.operation_completed.connect(self._on_operation_completed)
-        self.progress_bar.operation_failed.connect(self._on_operation_failed)
-        
         # Initially hidden
         self.setVisible(False)
     
@@ -265,29 +301,17 @@ class FileProgressWidget(QWidget):
         Args:
             operation: Type of file operation
             file_name: Name of the file
-            status_message: Status message to display
+            status_message: Status message to display instead of the default text
             file_size: Size of the file in bytes
         """
-        if status_message:
-            self.status_label.setText(status_message)
-        else:
-            operation_name = operation.value.capitalize()
-            self.status_label.setText(f"{operation_name} file...")
-        
         self.progress_bar.start_file_operation(operation, file_name, file_size)
+        if status_message:
+            self.update_status(status_message)
         self.setVisible(True)
     
     def update_status(self, message: str):
         """Update the status message."""
-        self.status_label.setText(message)
-    
-    def _on_operation_completed(self, operation_type: str):
-        """Handle operation completion."""
-        self.status_label.setText(f"{operation_type.capitalize()} completed successfully")
-    
-    def _on_operation_failed(self, operation_type: str, error: str):
-        """Handle operation failure."""
-        self.status_label.setText(f"{operation_type.capitalize()} failed: {error}")
+        self.progress_bar.set_status_message(message)
     
     def hide_progress(self):
         """Hide the progress widget."""
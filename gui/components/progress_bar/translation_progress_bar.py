@@ -4,16 +4,30 @@ Translation Progress Bar Component
 Modern QProgressBar implementation for translation progress tracking.
 """
 
-from PyQt6.QtWidgets import QProgressBar, QWidget, QVBoxLayout, QLabel, QHBoxLayout
-from PyQt6.QtCore import pyqtSignal, QTimer, Qt, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QPalette
+from PyQt6.QtWidgets import QProgressBar, QWidget, QVBoxLayout, QLabel, QHBoxLayout, QGraphicsOpacityEffect
+from PyQt6.QtCore import (
+    pyqtSignal, QTimer, Qt, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QElapsedTimer
+)
+from PyQt6.QtGui import QShowEvent, QHideEvent
 from typing import Optional
+from collections import deque
+import time
+
+from .utils import batched_updates
+
+# Repaint at least this often while progress keeps arriving, even in small steps
+_MIN_UPDATE_INTERVAL_NS = 50_000_000
+
+# Progress samples kept for the container's rate estimate
+_RATE_SAMPLES = 32
 
 
 class TranslationProgressBar(QProgressBar):
     """Custom progress bar for translation operations with modern styling."""
     
-    # Signals
+    # Signals, emitted on the GUI thread only, so receivers can connect with
+    # Qt.ConnectionType.DirectConnection. Worker threads must not call
+    # update_progress directly; they emit their own signal, which Qt queues here.
     progress_updated = pyqtSignal(int)  # Current progress value
     operation_completed = pyqtSignal()  # Operation finished
     operation_cancelled = pyqtSignal()  # Operation cancelled
@@ -21,10 +35,14 @@ class TranslationProgressBar(QProgressBar):
     def __init__(self, parent=None):
         """Initialize the translation progress bar."""
         super().__init__(parent)
+        self._last_format = ""  # Format last passed to setFormat
         self._setup_ui()
         self._setup_animation()
         self._current_operation = ""
         self._is_indeterminate = False
+        self._update_step = 1  # Items between visible updates
+        self._last_emitted_value = 0
+        self._last_emit_ns = 0
     
     def _setup_ui(self):
         """Set up the UI components."""
@@ -38,14 +56,33 @@ class TranslationProgressBar(QProgressBar):
         self.setVisible(False)
         
         # Format string for progress text
-        self.setFormat("%p% - %v/%m items")
+        self._set_format("%p% - %v/%m items")
+        
+        # One reusable timer for the delayed hide after completion/cancellation
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide_progress)
+        
+        # Reused so repeated final updates complete the operation only once
+        self._complete_timer = QTimer(self)
+        self._complete_timer.setSingleShot(True)
+        self._complete_timer.timeout.connect(self._complete_operation)
     
     def _setup_animation(self):
         """Set up progress animation."""
-        self._pulse_timer = QTimer()
-        self._pulse_timer.timeout.connect(self._pulse_animation)
-        self._pulse_direction = 1
-        self._pulse_value = 0
+        # Indeterminate pulse: animate an opacity effect rather than restyling
+        # the chunk on every tick. The effect is only enabled while pulsing.
+        self._opacity_effect = QGraphicsOpacityEffect(self)
+        self._opacity_effect.setEnabled(False)
+        self.setGraphicsEffect(self._opacity_effect)
+        
+        self._pulse_anim = QPropertyAnimation(self._opacity_effect, b"opacity", self)
+        self._pulse_anim.setDuration(2000)
+        self._pulse_anim.setKeyValueAt(0.0, 0.3)
+        self._pulse_anim.setKeyValueAt(0.5, 1.0)
+        self._pulse_anim.setKeyValueAt(1.0, 0.3)
+        self._pulse_anim.setLoopCount(-1)
+        self._pulse_anim.setEasingCurve(QEasingCurve.Type.InOutSine)
         
         # Smooth progress animation
         self._animation = QPropertyAnimation(self, b"value")
@@ -61,22 +98,30 @@ class TranslationProgressBar(QProgressBar):
             total_items: Total number of items to process
             indeterminate: Whether progress is indeterminate
         """
+        # Pending completion/hide belong to the previous operation
+        self._complete_timer.stop()
+        self._hide_timer.stop()
+        self._animation.stop()  # Don't let the previous value animation land
         self._current_operation = operation_name
         self._is_indeterminate = indeterminate
         
-        if indeterminate:
-            self.setMinimum(0)
-            self.setMaximum(0)
-            self.setFormat(f"{operation_name}...")
-            self._start_pulse_animation()
-        else:
-            self.setMinimum(0)
-            self.setMaximum(total_items)
-            self.setValue(0)
-            self.setFormat(f"{operation_name} - %p% (%v/%m)")
-            self._stop_pulse_animation()
-        
-        self.setVisible(True)
+        with batched_updates(self):
+            if indeterminate:
+                self.setMinimum(0)
+                self.setMaximum(0)
+                self._set_format(f"{operation_name}...")
+                self._start_pulse_animation()
+            else:
+                self.setMinimum(0)
+                self.setMaximum(total_items)
+                self.setValue(0)
+                self._update_step = max(1, total_items // 100)
+                self._last_emitted_value = 0
+                self._last_emit_ns = 0
+                self._set_format(f"{operation_name} - %p% (%v/%m)")
+                self._stop_pulse_animation()
+            
+            self.setVisible(True)
     
     def update_progress(self, current: int, message: str = ""):
         """
@@ -88,23 +133,39 @@ class TranslationProgressBar(QProgressBar):
         """
         if self._is_indeterminate:
             return
+        
+        # Coalesce small steps into one repaint; messages and the final value
+        # are always shown
+        now = time.monotonic_ns()
+        if (message or current >= self.maximum()
+                or abs(current - self._last_emitted_value) >= self._update_step
+                or now - self._last_emit_ns >= _MIN_UPDATE_INTERVAL_NS):
+            self._last_emitted_value = current
+            self._last_emit_ns = now
             
-        # Animate to new value
-        self._animation.setStartValue(self.value())
-        self._animation.setEndValue(current)
-        self._animation.start()
-        
-        # Update format with message
-        if message:
-            self.setFormat(f"{self._current_operation} - {message} (%p%)")
-        else:
-            self.setFormat(f"{self._current_operation} - %p% (%v/%m)")
+            # Animate to new value, retargeting a running animation in place;
+            # steps under 1% of the range are set directly
+            maximum = self.maximum()
+            if self._animation.state() == QAbstractAnimation.State.Running:
+                self._animation.setEndValue(current)
+            elif maximum <= 0 or abs(current - self.value()) * 100 < maximum:
+                self.setValue(current)
+            else:
+                self._animation.setStartValue(self.value())
+                self._animation.setEndValue(current)
+                self._animation.start()
+            
+            # Update format with message
+            if message:
+                self._set_format(f"{self._current_operation} - {message} (%p%)")
+            else:
+                self._set_format(f"{self._current_operation} - %p% (%v/%m)")
         
         self.progress_updated.emit(current)
         
         # Check if completed
         if current >= self.maximum():
-            QTimer.singleShot(500, self._complete_operation)
+            self._complete_timer.start(500)
     
     def set_error_state(self, error_message: str):
         """
@@ -114,12 +175,8 @@ class TranslationProgressBar(QProgressBar):
             error_message: Error message to display
         """
         self._stop_pulse_animation()
-        self.setFormat(f"Error: {error_message}")
-        self.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #dc3545;
-            }
-        """)
+        self._set_format(f"Error: {error_message}")
+        self._set_state("error")
     
     def set_warning_state(self, warning_message: str):
         """
@@ -128,12 +185,8 @@ class TranslationProgressBar(QProgressBar):
         Args:
             warning_message: Warning message to display
         """
-        self.setFormat(f"Warning: {warning_message}")
-        self.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #ffc107;
-            }
-        """)
+        self._set_format(f"Warning: {warning_message}")
+        self._set_state("warning")
     
     def set_success_state(self, success_message: str = ""):
         """
@@ -144,14 +197,10 @@ class TranslationProgressBar(QProgressBar):
         """
         self._stop_pulse_animation()
         message = success_message or f"{self._current_operation} completed"
-        self.setFormat(message)
-        self.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #28a745;
-            }
-        """)
-        
-        QTimer.singleShot(2000, self.hide_progress)
+        self._set_format(message)
+        self._set_state("success")
+        
+        self._hide_timer.start(2000)
     
     def _complete_operation(self):
         """Handle operation completion."""
@@ -161,45 +210,64 @@ class TranslationProgressBar(QProgressBar):
     def cancel_operation(self):
         """Cancel the current operation."""
         self._stop_pulse_animation()
-        self.setFormat("Operation cancelled")
+        self._set_format("Operation cancelled")
         self.operation_cancelled.emit()
-        QTimer.singleShot(1000, self.hide_progress)
+        self._hide_timer.start(1000)
     
     def hide_progress(self):
         """Hide the progress bar."""
-        self.setVisible(False)
-        self.reset()
+        self._complete_timer.stop()
+        self._hide_timer.stop()
+        self._stop_pulse_animation()
+        self._animation.stop()
+        with batched_updates(self):
+            self.setVisible(False)
+            self.reset()
+            self._reset_style()
         self._current_operation = ""
-        self._reset_style()
     
     def _reset_style(self):
         """Reset to default style."""
-        self.setStyleSheet("")
+        self._set_state("")
+    
+    def _set_format(self, fmt: str):
+        """Set the progress text format unless it is unchanged."""
+        if fmt != self._last_format:
+            self._last_format = fmt
+            self.setFormat(fmt)
+    
+    def _set_state(self, state: str):
+        """Update the state property, repolishing only when it changes."""
+        if self.property("state") == state:
+            return
+        
+        # Chunk colours per state live in gui/styles/progress_bars.qss
+        self.setProperty("state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
     
     def _start_pulse_animation(self):
         """Start pulse animation for indeterminate progress."""
-        self._pulse_timer.start(50)  # 50ms intervals
+        self._opacity_effect.setEnabled(True)
+        self._pulse_anim.start()
+    
+    def showEvent(self, event: QShowEvent):
+        """Resume a paused pulse when shown."""
+        super().showEvent(event)
+        if self._pulse_anim.state() == QAbstractAnimation.State.Paused:
+            self._pulse_anim.resume()
+    
+    def hideEvent(self, event: QHideEvent):
+        """Pause the pulse while hidden."""
+        super().hideEvent(event)
+        if self._pulse_anim.state() == QAbstractAnimation.State.Running:
+            self._pulse_anim.pause()
     
     def _stop_pulse_animation(self):
         """Stop pulse animation."""
-        self._pulse_timer.stop()
-    
-    def _pulse_animation(self):
-        """Animate pulse effect for indeterminate progress."""
-        self._pulse_value += self._pulse_direction * 2
-        
-        if self._pulse_value >= 100:
-            self._pulse_direction = -1
-        elif self._pulse_value <= 0:
-            self._pulse_direction = 1
-        
-        # Apply pulse effect through style
-        opacity = 0.3 + (self._pulse_value / 100.0) * 0.7
-        self.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background-color: rgba(0, 123, 255, {opacity});
-            }}
-        """)
+        self._pulse_anim.stop()
+        self._opacity_effect.setEnabled(False)
     
     def get_current_operation(self) -> str:
         """
@@ -240,16 +308,14 @@ class TranslationProgressBar(QProgressBar):
             rate: Processing rate (items per second)
         """
         if rate > 0:
-            eta_seconds = (total - processed) / rate
-            eta_minutes = int(eta_seconds // 60)
-            eta_seconds = int(eta_seconds % 60)
+            eta_minutes, eta_seconds = divmod(int((total - processed) / rate), 60)
             
-            self.setFormat(
+            self._set_format(
                 f"{self._current_operation} - {processed}/{total} "
                 f"({rate:.1f}/s, ETA: {eta_minutes:02d}:{eta_seconds:02d})"
             )
         else:
-            self.setFormat(f"{self._current_operation} - {processed}/{total}")
+            self._set_format(f"{self._current_operation} - {processed}/{total}")
 
 
 class ProgressBarContainer(QWidget):
@@ -258,6 +324,12 @@ class ProgressBarContainer(QWidget):
     def __init__(self, parent=None):
         """Initialize the progress bar container."""
         super().__init__(parent)
+        
+        # Elapsed time and rate are tracked here rather than formatted by callers
+        self._elapsed = QElapsedTimer()
+        self._samples = deque(maxlen=_RATE_SAMPLES)  # (elapsed ns, items processed)
+        self._elapsed_s = -1  # Last elapsed second shown
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -274,7 +346,22 @@ class ProgressBarContainer(QWidget):
         # Progress bar
         self.progress_bar = TranslationProgressBar()
         
-        # Details layout
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress_bar)
+        
+        # Time/rate row, created by _ensure_details on the first timed update
+        self._details_layout: Optional[QHBoxLayout] = None
+        self.time_label: Optional[QLabel] = None
+        self.rate_label: Optional[QLabel] = None
+        
+        # Initially hidden
+        self.setVisible(False)
+    
+    def _ensure_details(self):
+        """Create the time/rate row if it does not exist yet."""
+        if self._details_layout is not None:
+            return
+        
         details_layout = QHBoxLayout()
         details_layout.setContentsMargins(0, 0, 0, 0)
         
@@ -290,33 +377,54 @@ class ProgressBarContainer(QWidget):
         details_layout.addStretch()
         details_layout.addWidget(self.rate_label)
         
-        layout.addWidget(self.status_label)
-        layout.addWidget(self.progress_bar)
-        layout.addLayout(details_layout)
-        
-        # Initially hidden
-        self.setVisible(False)
+        self.layout().addLayout(details_layout)
+        self._details_layout = details_layout
+    
+    def _clear_details(self):
+        """Clear the time/rate labels, if they have been created."""
+        if self._details_layout is not None:
+            self.time_label.setText("")
+            self.rate_label.setText("")
     
     def start_operation(self, operation_name: str, status: str = "", total_items: int = 100):
         """Start operation with status."""
         self.status_label.setText(status or f"Starting {operation_name}...")
-        self.time_label.setText("")
-        self.rate_label.setText("")
+        self._clear_details()
+        self._elapsed.start()
+        self._samples.clear()
+        self._samples.append((0, 0))
+        self._elapsed_s = -1
         self.progress_bar.start_operation(operation_name, total_items)
         self.setVisible(True)
     
-    def update_progress(self, current: int, status: str = "", elapsed_time: str = "", rate: str = ""):
-        """Update progress with additional information."""
+    def update_progress(self, current: int, status: str = ""):
+        """Update progress; elapsed time and rate are derived from the samples."""
         if status:
             self.status_label.setText(status)
-        if elapsed_time:
-            self.time_label.setText(f"Elapsed: {elapsed_time}")
-        if rate:
-            self.rate_label.setText(f"Rate: {rate}")
+        
+        if self._elapsed.isValid():
+            now_ns = self._elapsed.nsecsElapsed()
+            self._samples.append((now_ns, current))
+            self._ensure_details()
+            
+            # Both labels change at most once per elapsed second
+            elapsed_s = now_ns // 1_000_000_000
+            if elapsed_s != self._elapsed_s:
+                self._elapsed_s = elapsed_s
+                minutes, seconds = divmod(elapsed_s, 60)
+                self.time_label.setText(f"Elapsed: {minutes:02d}:{seconds:02d}")
+                
+                # Rate over the sample window
+                first_ns, first_count = self._samples[0]
+                if now_ns > first_ns:
+                    rate = (current - first_count) * 1e9 / (now_ns - first_ns)
+                    self.rate_label.setText(f"Rate: {rate:.1f}/s")
         
         self.progress_bar.update_progress(current)
     
     def hide_progress(self):
         """Hide the entire progress container."""
+        self._elapsed.invalidate()
+        self._clear_details()
         self.progress_bar.hide_progress()
         self.setVisible(False)
@@ -0,0 +1,28 @@
+"""
+Progress Bar Utilities
+
+Helpers shared by the progress bar components.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from PyQt6.QtWidgets import QWidget
+
+
+@contextmanager
+def batched_updates(widget: QWidget) -> Iterator[None]:
+    """
+    Apply a group of widget changes with one repaint and no intermediate signals.
+    
+    Args:
+        widget: The widget being reconfigured
+    """
+    widget.setUpdatesEnabled(False)
+    was_blocked = widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(was_blocked)
+        widget.setUpdatesEnabled(True)
+        widget.update()
@@ -0,0 +1,32 @@
+"""
+GUI Resources
+
+Registers the bundled asset directories as Qt search paths and caches icons
+loaded from them, so stylesheets and buttons resolve images without
+repeated disk lookups or depending on the working directory.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from PyQt6.QtCore import QDir
+from PyQt6.QtGui import QIcon
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+
+# Bundled icons resolve as "icons:<file name>", e.g. in QSS url(icons:dropdown_arrow.png)
+QDir.addSearchPath('icons', str(ASSETS_DIR / 'icons'))
+
+
+@lru_cache(maxsize=64)
+def load_icon(icon_path: str) -> QIcon:
+    """
+    Load an icon once and share it between widgets.
+    
+    Args:
+        icon_path: File system path or "icons:"-prefixed resource path
+        
+    Returns:
+        Cached icon
+    """
+    return QIcon(icon_path)
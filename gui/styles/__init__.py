@@ -4,13 +4,21 @@ Styles Package
 This package contains all styling definitions for the Excel Translator application.
 """
 
-from .global_style import get_application_stylesheet, get_theme_color, get_typography_value
-from .component_styles import get_all_styles, get_component_style
+from .global_style import (
+    get_application_stylesheet, get_widget_stylesheet, get_theme_color, get_typography_value,
+    install_application_stylesheet
+)
+from .component_styles import get_all_styles, get_component_style, apply_to
+from .button_styles import get_button_stylesheet
 
 __all__ = [
     'get_application_stylesheet',
+    'get_widget_stylesheet',
     'get_theme_color',
     'get_typography_value',
+    'install_application_stylesheet',
     'get_all_styles',
-    'get_component_style'
+    'get_component_style',
+    'apply_to',
+    'get_button_stylesheet'
 ]
@@ -0,0 +1,69 @@
+"""
+Stylesheet minifier
+
+Strips what Qt's stylesheet parser would otherwise tokenize and discard.
+"""
+
+import re
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+# Quoted strings, braces, and the plain text between them
+_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|[{}]|[^{}"\']+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SELECTOR_PUNCTUATION_RE = re.compile(r'\s*,\s*')
+_DECLARATION_PUNCTUATION_RE = re.compile(r'\s*([:;,])\s*')
+_LEADING_ZERO_RE = re.compile(r'(?<![\w.#-])0(\.\d)')
+_HEX_COLOR_RE = re.compile(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3(?![\w-])')
+
+
+def _minify_declarations(text: str) -> str:
+    """Minify text inside a declaration block, between quoted strings."""
+    text = _WHITESPACE_RE.sub(' ', text)
+    text = _DECLARATION_PUNCTUATION_RE.sub(r'\1', text)
+    text = _LEADING_ZERO_RE.sub(r'\1', text)
+    return _HEX_COLOR_RE.sub(r'#\1\2\3', text)
+
+
+def _minify_selectors(text: str) -> str:
+    """Minify selector text; spaces are descendant combinators and are kept."""
+    text = _WHITESPACE_RE.sub(' ', text)
+    return _SELECTOR_PUNCTUATION_RE.sub(',', text)
+
+
+def minify_qss(stylesheet: str) -> str:
+    """
+    Remove comments and redundant whitespace from a stylesheet, and
+    shorten numbers and colours that have a shorter equivalent.
+    
+    Selectors only have their whitespace collapsed, and quoted strings are
+    kept as written.
+    
+    Args:
+        stylesheet: Stylesheet text
+    
+    Returns:
+        Minified stylesheet
+    """
+    tokens = _TOKEN_RE.findall(_COMMENT_RE.sub('', stylesheet))
+    parts = []
+    depth = 0
+    for index, token in enumerate(tokens):
+        if token == '{':
+            depth += 1
+            parts.append(token)
+        elif token == '}':
+            depth = max(depth - 1, 0)
+            if parts and parts[-1].endswith(';'):
+                parts[-1] = parts[-1][:-1]
+            parts.append(token)
+        elif token[0] in '"\'':
+            parts.append(token)
+        else:
+            text = _minify_declarations(token) if depth else _minify_selectors(token)
+            # Whitespace next to a brace, or at either end, carries no meaning
+            if index == 0 or tokens[index - 1] in '{}':
+                text = text.lstrip()
+            if index == len(tokens) - 1 or tokens[index + 1] in '{}':
+                text = text.rstrip()
+            parts.append(text)
+    return ''.join(parts).strip()
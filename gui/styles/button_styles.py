@@ -4,92 +4,128 @@ Button Component Styles
 CSS styles for all button components.
 """
 
-BUTTON_STYLES = """
+import functools
+import re
+from pathlib import Path
+
+from ._minify import minify_qss
+
+# Class-selector rules for the custom button widgets, parsed once as part of
+# the application stylesheet instead of per instance
+BUTTON_WIDGET_STYLES = minify_qss(
+    Path(__file__).with_name('buttons.qss').read_text(encoding='utf-8')
+)
+
+# Colour tokens referenced as @name in BUTTON_STYLE_TEMPLATE
+PALETTE = {
+    'primary': '#007bff',
+    'primary_hover': '#0056b3',
+    'primary_pressed': '#004085',
+    'success': '#28a745',
+    'success_hover': '#1e7e34',
+    'success_pressed': '#155724',
+    'danger': '#dc3545',
+    'danger_hover': '#c82333',
+    'danger_pressed': '#bd2130',
+    'secondary': '#6c757d',
+    'secondary_hover': '#545b62',
+    'warning': '#ffc107',
+    'light': '#f8f9fa',
+    'gray_200': '#e9ecef',
+    'gray_300': '#dee2e6',
+    'gray_500': '#adb5bd',
+    'gray_700': '#495057',
+    'text_dark': '#212529',
+    'focus': '#80bdff',
+}
+
+_TOKEN_RE = re.compile(r'@([a-z0-9_]+)')
+
+# Only properties Qt's stylesheet engine understands belong here; CSS-only
+# ones such as transform are discarded by the parser on every restyle
+BUTTON_STYLE_TEMPLATE = """
 /* Base Button Styles */
 QPushButton {
     border: none;
     border-radius: 6px;
-    font-family: 'Segoe UI', 'SF Pro Display', system-ui, sans-serif;
     font-size: 13px;
     font-weight: 500;
     padding: 8px 16px;
     min-height: 20px;
-    background-color: #f8f9fa;
-    color: #495057;
+    background-color: @light;
+    color: @gray_700;
     outline: none;
 }
 
 QPushButton:hover {
-    background-color: #e9ecef;
-    transform: translateY(-1px);
+    background-color: @gray_200;
 }
 
 QPushButton:pressed {
-    background-color: #dee2e6;
-    transform: translateY(0px);
+    background-color: @gray_300;
 }
 
 QPushButton:disabled {
-    background-color: #e9ecef;
-    color: #6c757d;
-    border: 1px solid #dee2e6;
+    background-color: @gray_200;
+    color: @secondary;
+    border: 1px solid @gray_300;
 }
 
 /* Primary Button Styles */
 QPushButton#translateButton,
 QPushButton#exportButton {
-    background-color: #007bff;
+    background-color: @primary;
     color: white;
     font-weight: 600;
 }
 
 QPushButton#translateButton:hover,
 QPushButton#exportButton:hover {
-    background-color: #0056b3;
+    background-color: @primary_hover;
 }
 
 QPushButton#translateButton:pressed,
 QPushButton#exportButton:pressed {
-    background-color: #004085;
+    background-color: @primary_pressed;
 }
 
 QPushButton#translateButton:disabled,
 QPushButton#exportButton:disabled {
-    background-color: #6c757d;
+    background-color: @secondary;
     color: #ffffff;
 }
 
 /* Success Button Styles */
 QPushButton#selectFileButton {
-    background-color: #28a745;
+    background-color: @success;
     color: white;
 }
 
 QPushButton#selectFileButton:hover {
-    background-color: #1e7e34;
+    background-color: @success_hover;
 }
 
 QPushButton#selectFileButton:pressed {
-    background-color: #155724;
+    background-color: @success_pressed;
 }
 
 /* Danger Button Styles */
 QPushButton#cancelButton {
-    background-color: #dc3545;
+    background-color: @danger;
     color: white;
 }
 
 QPushButton#cancelButton:hover {
-    background-color: #c82333;
+    background-color: @danger_hover;
 }
 
 QPushButton#cancelButton:pressed {
-    background-color: #bd2130;
+    background-color: @danger_pressed;
 }
 
 /* Secondary Button Styles */
 QPushButton#swapButton {
-    background-color: #6c757d;
+    background-color: @secondary;
     color: white;
     border-radius: 50%;
     min-width: 32px;
@@ -100,22 +136,22 @@ QPushButton#swapButton {
 }
 
 QPushButton#swapButton:hover {
-    background-color: #545b62;
+    background-color: @secondary_hover;
 }
 
 QPushButton#swapButton:pressed {
-    background-color: #495057;
+    background-color: @gray_700;
 }
 
 /* Processing Animation */
 QPushButton.processing {
-    background-color: #ffc107;
-    color: #212529;
+    background-color: @warning;
+    color: @text_dark;
 }
 
 QPushButton.processing:disabled {
-    background-color: #ffc107;
-    color: #212529;
+    background-color: @warning;
+    color: @text_dark;
 }
 
 /* Icon Buttons */
@@ -131,17 +167,17 @@ QPushButton.icon-button {
 /* Flat Button Variant */
 QPushButton.flat {
     background-color: transparent;
-    border: 1px solid #dee2e6;
+    border: 1px solid @gray_300;
 }
 
 QPushButton.flat:hover {
-    background-color: #f8f9fa;
-    border-color: #adb5bd;
+    background-color: @light;
+    border-color: @gray_500;
 }
 
 QPushButton.flat:pressed {
-    background-color: #e9ecef;
-    border-color: #6c757d;
+    background-color: @gray_200;
+    border-color: @secondary;
 }
 
 /* Large Button Variant */
@@ -160,14 +196,14 @@ QPushButton.small {
 
 /* Button Focus States */
 QPushButton:focus {
-    outline: 2px solid #80bdff;
+    outline: 2px solid @focus;
     outline-offset: 2px;
 }
 
 /* Button Group Styles */
 .button-group QPushButton {
     border-radius: 0;
-    border-right: 1px solid #dee2e6;
+    border-right: 1px solid @gray_300;
 }
 
 .button-group QPushButton:first-child {
@@ -190,15 +226,33 @@ QToolButton {
 }
 
 QToolButton:hover {
-    background-color: #e9ecef;
+    background-color: @gray_200;
 }
 
 QToolButton:pressed {
-    background-color: #dee2e6;
+    background-color: @gray_300;
 }
 
 QToolButton:checked {
-    background-color: #007bff;
+    background-color: @primary;
     color: white;
 }
 """
+
+
+@functools.lru_cache(maxsize=1)
+def get_button_stylesheet() -> str:
+    """
+    Get the resolved button stylesheet.
+    
+    Palette tokens are substituted and comments and extra whitespace are
+    stripped once; later calls return the cached string.
+    
+    Returns:
+        Button stylesheet including the custom widget rules
+    """
+    resolved = _TOKEN_RE.sub(lambda match: PALETTE[match.group(1)], BUTTON_STYLE_TEMPLATE)
+    return minify_qss(resolved) + '\n' + BUTTON_WIDGET_STYLES
+
+
+BUTTON_STYLES = get_button_stylesheet()
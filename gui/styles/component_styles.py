@@ -5,75 +5,74 @@ This module contains styling definitions for individual UI components
 to maintain a consistent and modern appearance throughout the application.
 """
 
-from .button_styles import BUTTON_STYLES
-from .combo_box_styles import COMBO_BOX_STYLES
-from .progress_bar_styles import PROGRESS_BAR_STYLES
-from .check_box_styles import CHECK_BOX_STYLES
-from .drag_drop_styles import DRAG_DROP_STYLES
-from .main_window_styles import MAIN_WINDOW_STYLES
+import functools
+import importlib
 
-# Combine all component styles
-COMPONENT_STYLES = f"""
-{BUTTON_STYLES}
-
-{COMBO_BOX_STYLES}
-
-{PROGRESS_BAR_STYLES}
-
-{CHECK_BOX_STYLES}
-
-{DRAG_DROP_STYLES}
-
-{MAIN_WINDOW_STYLES}
-"""
+# Component names in stylesheet order; each maps to <name>_styles.<NAME>_STYLES,
+# imported on first use
+COMPONENT_NAMES = (
+    'button', 'combo_box', 'progress_bar', 'check_box', 'drag_drop', 'main_window'
+)
 
 # Individual style getters for specific components
 def get_button_styles():
     """Get button component styles."""
-    return BUTTON_STYLES
+    return get_component_style('button')
 
 def get_combo_box_styles():
     """Get combo box component styles."""
-    return COMBO_BOX_STYLES
+    return get_component_style('combo_box')
 
 def get_progress_bar_styles():
     """Get progress bar component styles."""
-    return PROGRESS_BAR_STYLES
+    return get_component_style('progress_bar')
 
 def get_check_box_styles():
     """Get check box component styles."""
-    return CHECK_BOX_STYLES
+    return get_component_style('check_box')
 
 def get_drag_drop_styles():
     """Get drag and drop component styles."""
-    return DRAG_DROP_STYLES
+    return get_component_style('drag_drop')
 
 def get_main_window_styles():
     """Get main window component styles."""
-    return MAIN_WINDOW_STYLES
+    return get_component_style('main_window')
 
+@functools.lru_cache(maxsize=16)
 def get_component_style(component_name: str) -> str:
     """
     Get styles for a specific component.
     
+    Only the requested component's style module is imported, and each
+    name is resolved once.
+    
     Args:
         component_name: Name of the component
         
     Returns:
         CSS styles for the component
     """
-    style_getters = {
-        'button': get_button_styles,
-        'combo_box': get_combo_box_styles,
-        'progress_bar': get_progress_bar_styles,
-        'check_box': get_check_box_styles,
-        'drag_drop': get_drag_drop_styles,
-        'main_window': get_main_window_styles,
-    }
+    if component_name not in COMPONENT_NAMES:
+        return ""
     
-    getter = style_getters.get(component_name)
-    return getter() if getter else ""
+    module = importlib.import_module(f".{component_name}_styles", __package__)
+    return getattr(module, f"{component_name.upper()}_STYLES")
+
+def apply_to(widget, component_name: str):
+    """
+    Style a single widget with one component's rules.
+    
+    The widget's own stylesheet is only matched against that widget and its
+    children, so the application stylesheet can stay small.
+    
+    Args:
+        widget: Widget to style
+        component_name: Name of the component
+    """
+    widget.setStyleSheet(get_component_style(component_name))
 
+@functools.lru_cache(maxsize=1)
 def get_all_styles() -> str:
     """
     Get all component styles combined.
@@ -81,4 +80,4 @@ def get_all_styles() -> str:
     Returns:
         All CSS styles combined
     """
-    return COMPONENT_STYLES
+    return "\n" + "\n\n".join(get_component_style(name) for name in COMPONENT_NAMES) + "\n"
@@ -5,8 +5,16 @@ This module provides the main styling system that combines all component
 styles and applies them consistently across the application.
 """
 
-from typing import Dict, Optional
+import functools
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtWidgets import QApplication
+
+from ._minify import minify_qss
 from .component_styles import get_all_styles
+from .button_styles import BUTTON_WIDGET_STYLES
+from .progress_bar_styles import PROGRESS_BAR_WIDGET_STYLES
 
 # Base application theme colors
 THEME_COLORS = {
@@ -56,15 +64,18 @@ BORDER_RADIUS = {
     'full': '50%'
 }
 
-# Global base styles
-GLOBAL_BASE_STYLES = f"""
+def _render_base_styles() -> str:
+    """
+    Resolve the theme tokens into the minified global base stylesheet.
+    
+    Returns:
+        Global base stylesheet
+    """
+    return minify_qss(f"""
 /* Global Application Styles */
-* {{
+QWidget {{
     font-family: {TYPOGRAPHY['font_family']};
     outline: none;
-}}
-
-QWidget {{
     background-color: {THEME_COLORS['white']};
     color: #495057;
     font-size: {TYPOGRAPHY['font_size_base']};
@@ -83,22 +94,17 @@ QToolTip {{
 }}
 
 /* Focus styles for accessibility */
-*:focus {{
+QWidget:focus {{
     outline: 2px solid #80bdff;
     outline-offset: 2px;
 }}
 
 /* Disabled widget styles */
-*:disabled {{
+QWidget:disabled {{
     color: #6c757d;
     background-color: #e9ecef;
 }}
 
-/* Animation support */
-* {{
-    transition: all 0.2s ease-in-out;
-}}
-
 /* Scrollbar base styles */
 QScrollBar {{
     background-color: {THEME_COLORS['light']};
@@ -124,22 +130,41 @@ QScrollBar::add-line, QScrollBar::sub-line {{
 QScrollBar::add-page, QScrollBar::sub-page {{
     background: none;
 }}
-"""
+""")
+
+# Global base styles
+GLOBAL_BASE_STYLES = _render_base_styles()
 
-def apply_global_styles() -> str:
+# Every part is constant, so each theme's stylesheet is built once, on first use
+def apply_global_styles(theme: str = 'light') -> str:
     """
-    Generate and return the complete global stylesheet.
+    Return the complete global stylesheet.
+    
+    Args:
+        theme: 'light', or 'dark' to append the dark theme overrides
     
     Returns:
         Complete CSS stylesheet string
     """
-    component_styles = get_all_styles()
-    
-    return f"""
+    return _build_global_styles(theme)
+
+@functools.lru_cache(maxsize=2)
+def _build_global_styles(theme: str) -> str:
+    """Join the global and component styles; cached per theme."""
+    stylesheet = f"""
     {GLOBAL_BASE_STYLES}
     
-    {component_styles}
+    {get_all_styles()}
     """
+    if theme == 'dark':
+        stylesheet += get_dark_theme_styles()
+    return stylesheet
+
+# Fallbacks for the value getters, looked up once
+_DEFAULT_THEME_COLOR = THEME_COLORS['primary']
+_DEFAULT_TYPOGRAPHY = TYPOGRAPHY['font_size_base']
+_DEFAULT_SPACING = SPACING['md']
+_DEFAULT_BORDER_RADIUS = BORDER_RADIUS['base']
 
 def get_theme_color(color_name: str) -> str:
     """
@@ -151,7 +176,7 @@ def get_theme_color(color_name: str) -> str:
     Returns:
         Color hex value or default
     """
-    return THEME_COLORS.get(color_name, THEME_COLORS['primary'])
+    return THEME_COLORS.get(color_name, _DEFAULT_THEME_COLOR)
 
 def get_typography_value(property_name: str) -> str:
     """
@@ -163,7 +188,7 @@ def get_typography_value(property_name: str) -> str:
     Returns:
         Typography value or default
     """
-    return TYPOGRAPHY.get(property_name, TYPOGRAPHY['font_size_base'])
+    return TYPOGRAPHY.get(property_name, _DEFAULT_TYPOGRAPHY)
 
 def get_spacing_value(size_name: str) -> str:
     """
@@ -175,7 +200,7 @@ def get_spacing_value(size_name: str) -> str:
     Returns:
         Spacing value or default
     """
-    return SPACING.get(size_name, SPACING['md'])
+    return SPACING.get(size_name, _DEFAULT_SPACING)
 
 def get_border_radius_value(size_name: str) -> str:
     """
@@ -187,7 +212,7 @@ def get_border_radius_value(size_name: str) -> str:
     Returns:
         Border radius value or default
     """
-    return BORDER_RADIUS.get(size_name, BORDER_RADIUS['base'])
+    return BORDER_RADIUS.get(size_name, _DEFAULT_BORDER_RADIUS)
 
 def create_custom_stylesheet(
     base_styles: bool = True,
@@ -205,6 +230,15 @@ def create_custom_stylesheet(
     Returns:
         Custom stylesheet string
     """
+    return _build_custom_stylesheet(base_styles, tuple(components or ()), custom_styles)
+
+@functools.lru_cache(maxsize=16)
+def _build_custom_stylesheet(
+    base_styles: bool,
+    components: Tuple[str, ...],
+    custom_styles: str
+) -> str:
+    """Join the requested style parts; cached per argument combination."""
     stylesheet_parts = []
     
     if base_styles:
@@ -225,50 +259,64 @@ def create_custom_stylesheet(
     
     return "\n\n".join(stylesheet_parts)
 
+@functools.lru_cache(maxsize=1)
 def get_dark_theme_styles() -> str:
     """
-    Generate dark theme styles.
+    Get the dark theme overrides.
+    
+    The rules are unconditional and follow the light rules in the dark
+    application stylesheet, so widgets need no theme property to match.
     
     Returns:
         Dark theme CSS styles
     """
-    return """
-    /* Dark Theme Overrides */
-    QWidget[darkTheme="true"] {
-        background-color: #343a40;
-        color: #f8f9fa;
-    }
-    
-    QWidget[darkTheme="true"]:disabled {
-        color: #6c757d;
-        background-color: #495057;
-    }
-    
-    QToolTip[darkTheme="true"] {
-        background-color: #212529;
-        color: #f8f9fa;
-        border-color: #495057;
-    }
-    
-    QScrollBar[darkTheme="true"] {
-        background-color: #495057;
-    }
+    return minify_qss(
+        Path(__file__).with_name('dark_overrides.qss').read_text(encoding='utf-8')
+    )
+
+def get_widget_stylesheet() -> str:
+    """
+    Get the class-selector styles for the custom widgets.
     
-    QScrollBar[darkTheme="true"]::handle {
-        background-color: #6c757d;
-    }
+    Windows that ship their own theme append these rules to it so the
+    custom widgets keep their look without per-instance stylesheets.
     
-    QScrollBar[darkTheme="true"]::handle:hover {
-        background-color: #868e96;
-    }
+    Returns:
+        Custom widget stylesheet
     """
+    return BUTTON_WIDGET_STYLES + PROGRESS_BAR_WIDGET_STYLES
 
 # Main stylesheet function for easy import
-def get_application_stylesheet() -> str:
+def get_application_stylesheet(theme: str = 'light') -> str:
     """
     Get the complete application stylesheet.
     
+    Args:
+        theme: 'light' or 'dark'
+    
     Returns:
         Complete application stylesheet
     """
-    return apply_global_styles()
+    return apply_global_styles(theme)
+
+# Stylesheet object last installed by install_application_stylesheet
+_installed_stylesheet: Optional[str] = None
+
+def install_application_stylesheet(stylesheet: str) -> None:
+    """
+    Install a stylesheet on the application unless it is already installed.
+    
+    Setting an identical sheet again would still re-polish every widget.
+    The cached sheets are reused objects, so re-installing one is caught by
+    identity before the installed sheet is converted back and compared.
+    
+    Args:
+        stylesheet: Complete application stylesheet
+    """
+    global _installed_stylesheet
+    app = QApplication.instance()
+    if app is None or stylesheet is _installed_stylesheet:
+        return
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+    _installed_stylesheet = stylesheet
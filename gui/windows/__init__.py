@@ -4,8 +4,20 @@ Windows Package
 This package contains all window components for the Excel Translator application.
 """
 
-from .main_window import ModernMainWindow
-
 __all__ = [
     'ModernMainWindow'
 ]
+
+
+def __getattr__(name):
+    """Import the main window on first access."""
+    if name != 'ModernMainWindow':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from .main_window import ModernMainWindow
+    globals()[name] = ModernMainWindow  # Cache so later lookups skip __getattr__
+    return ModernMainWindow
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,6 +7,7 @@ Main window using the new architecture with clean separation of concerns.
 import sys
 import os
 import json
+import functools
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -32,6 +33,23 @@ from gui.components.button.cancel_button import CancelButton
 from gui.components.button.export_button import ExportButton
 from gui.components.button.select_file_button import SelectFileButton
 from gui.components.button.swap_button import SwapButton
+from gui.resources import ASSETS_DIR
+from gui.styles.global_style import get_widget_stylesheet
+
+
+# Theme for the main window
+_THEME_FILE = ASSETS_DIR / 'dark_theme.qss'
+
+
+@functools.lru_cache(maxsize=1)
+def _read_theme() -> str:
+    """
+    Read the main window theme once.
+    
+    Returns:
+        Theme stylesheet, or an empty string if the file is missing
+    """
+    return _THEME_FILE.read_text(encoding='utf-8') if _THEME_FILE.exists() else ""
 
 
 class ModernMainWindow(QMainWindow):
@@ -403,11 +421,13 @@ class ModernMainWindow(QMainWindow):
     
     def _apply_theme(self) -> None:
         """Apply the application theme."""
-        theme_file = Path('assets/dark_theme.qss')
         try:
-            if theme_file.exists():
-                with open(theme_file, 'r', encoding='utf-8') as f:
-                    self.setStyleSheet(f.read())
+            # The theme stays on this window so parentless dialogs keep the
+            # default look. The custom widget rules go on the central widget:
+            # a closer sheet wins over the window's regardless of specificity,
+            # as the per-button sheets did, and all buttons share one parse.
+            self.setStyleSheet(_read_theme())
+            self.centralWidget().setStyleSheet(get_widget_stylesheet())
         except Exception as e:
             self.logger.error(f"Failed to apply theme: {e}")
     
@@ -55,8 +55,10 @@ def setup_application():
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
     
-    # Set default font
+    # Set default font; the stylesheets inherit it instead of each naming
+    # the family list again
     font = QFont("Segoe UI", 10)
+    font.setFamilies(["Segoe UI", "SF Pro Display", "system-ui", "sans-serif"])
     app.setFont(font)
     
     return app
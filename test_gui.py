@@ -21,7 +21,8 @@ from gui.components.progress_bar.translation_progress_bar import TranslationProg
 from gui.components.check_box.options_check_box import TranslationOptionsGroup
 
 # Import styles
-from gui.styles.global_style import get_application_stylesheet
+from gui.styles.global_style import create_custom_stylesheet
+from gui.styles.component_styles import apply_to
 
 
 class SimpleMainWindow(QMainWindow):
@@ -39,9 +40,12 @@ class SimpleMainWindow(QMainWindow):
         self.setWindowTitle("Excel Translator - Component Test")
         self.setMinimumSize(800, 600)
         
-        # Apply global styles
+        # Apply base styles; components with their own sheets are styled
+        # individually in _apply_component_styles
         try:
-            stylesheet = get_application_stylesheet()
+            stylesheet = create_custom_stylesheet(
+                components=['button', 'drag_drop', 'main_window']
+            )
             self.setStyleSheet(stylesheet)
         except Exception as e:
             print(f"Could not apply stylesheet: {e}")
@@ -108,6 +112,15 @@ class SimpleMainWindow(QMainWindow):
         
         # Status bar
         self.statusBar().showMessage("Ready")
+        
+        self._apply_component_styles()
+    
+    def _apply_component_styles(self):
+        """Give each styled component only the rules it needs."""
+        apply_to(self.source_combo, 'combo_box')
+        apply_to(self.target_combo, 'combo_box')
+        apply_to(self.options_group, 'check_box')
+        apply_to(self.progress_bar, 'progress_bar')
     
     def _setup_test_data(self):
         """Set up test data for the components."""
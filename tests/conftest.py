@@ -0,0 +1,26 @@
+"""
+Shared test configuration.
+
+Widgets are created on Qt's offscreen platform, so no display is needed;
+the QApplication and the qtbot fixture come from pytest-qt. Fixtures used
+by more than one test module live here.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def record_signal():
+    """Return a helper that collects a signal's emitted arguments in a list."""
+    def record(signal):
+        emitted = []
+        signal.connect(emitted.append)
+        return emitted
+    return record
@@ -0,0 +1,38 @@
+"""Tests for the Excel utility helpers."""
+
+import pytest
+
+from excel.utils import ExcelUtils
+
+
+@pytest.mark.parametrize("name", ["book.xlsx", "macros.xlsm", "legacy.xls", "Report.XLSX"])
+def test_existing_excel_files_are_valid(tmp_path, name):
+    path = tmp_path / name
+    path.touch()
+    
+    assert ExcelUtils.is_valid_excel_file(str(path))
+    assert ExcelUtils.is_valid_excel_file(path)
+
+
+def test_other_extensions_are_invalid(tmp_path):
+    path = tmp_path / "notes.csv"
+    path.touch()
+    
+    assert not ExcelUtils.is_valid_excel_file(str(path))
+
+
+@pytest.mark.parametrize("name", [".xlsx", ".xls"])
+def test_dotfile_named_like_an_extension_is_invalid(tmp_path, name):
+    path = tmp_path / name
+    path.touch()
+    
+    assert not ExcelUtils.is_valid_excel_file(str(path))
+
+
+def test_missing_file_is_invalid(tmp_path):
+    assert not ExcelUtils.is_valid_excel_file(str(tmp_path / "missing.xlsx"))
+
+
+@pytest.mark.parametrize("value", [None, 42, b"\xff.xlsx"])
+def test_non_path_values_are_invalid(value):
+    assert ExcelUtils.is_valid_excel_file(value) is False
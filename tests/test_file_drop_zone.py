@@ -0,0 +1,92 @@
+"""Tests for the file drop zone's dropped-file filtering."""
+
+import os
+
+import pytest
+
+from gui.components.drag_and_drop import file_drop_zone
+from gui.components.drag_and_drop.file_drop_zone import FileDropZone
+
+
+@pytest.fixture
+def zone(qtbot):
+    widget = FileDropZone()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def _touch(directory, name):
+    path = directory / name
+    path.touch()
+    return str(path)
+
+
+def test_keeps_existing_supported_files_in_drop_order(zone, tmp_path):
+    other = tmp_path / "other"
+    other.mkdir()
+    b = _touch(tmp_path, "b.xlsx")
+    c = _touch(other, "c.csv")
+    a = _touch(tmp_path, "a.xls")
+    
+    assert zone._filter_valid_files([b, c, a]) == [b, c, a]
+
+
+def test_drops_unsupported_missing_and_directory_entries(zone, tmp_path):
+    kept = _touch(tmp_path, "kept.xlsx")
+    text = _touch(tmp_path, "notes.txt")
+    missing = str(tmp_path / "missing.xlsx")
+    folder = tmp_path / "folder.xlsx"
+    folder.mkdir()
+    
+    assert zone._filter_valid_files([kept, text, missing, str(folder)]) == [kept]
+
+
+def test_extension_match_ignores_case(zone, tmp_path):
+    upper = _touch(tmp_path, "REPORT.XLSX")
+    mixed = _touch(tmp_path, "Data.Csv")
+    
+    assert zone._filter_valid_files([upper, mixed]) == [upper, mixed]
+
+
+def test_unreadable_directory_falls_back_to_stat(zone, tmp_path, monkeypatch):
+    first = _touch(tmp_path, "first.xlsx")
+    second = _touch(tmp_path, "second.xlsx")
+    missing = str(tmp_path / "missing.xlsx")
+    
+    def failing_scandir(path):
+        raise PermissionError(path)
+    
+    monkeypatch.setattr(file_drop_zone.os, "scandir", failing_scandir)
+    
+    assert zone._filter_valid_files([first, missing, second]) == [first, second]
+
+
+def test_names_missing_from_listing_fall_back_to_stat(zone, tmp_path, monkeypatch):
+    # Simulates a case-insensitive filesystem where the dropped name's case
+    # differs from the directory listing
+    first = _touch(tmp_path, "first.xlsx")
+    second = _touch(tmp_path, "second.xlsx")
+    real_scandir = os.scandir
+    
+    class _Listing:
+        def __init__(self, path):
+            self._entries = [e for e in real_scandir(path) if e.name != "second.xlsx"]
+        
+        def __enter__(self):
+            return iter(self._entries)
+        
+        def __exit__(self, *exc):
+            return False
+    
+    monkeypatch.setattr(file_drop_zone.os, "scandir", _Listing)
+    
+    assert zone._filter_valid_files([first, second]) == [first, second]
+
+
+def test_accepted_extensions_can_be_changed(zone, tmp_path):
+    sheet = _touch(tmp_path, "sheet.xlsx")
+    table = _touch(tmp_path, "table.ods")
+    
+    zone.set_accepted_extensions([".ods"])
+    
+    assert zone._filter_valid_files([sheet, table]) == [table]
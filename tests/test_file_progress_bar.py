@@ -0,0 +1,73 @@
+"""Tests for the file operation progress bar."""
+
+from gui.components.progress_bar.file_progress_bar import (
+    FileOperationType,
+    FileProgressWidget,
+)
+
+
+def _make_widget(qtbot):
+    widget = FileProgressWidget()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_status_message_survives_byte_progress_updates(qtbot):
+    widget = _make_widget(qtbot)
+    widget.start_operation(FileOperationType.LOADING, "data.xlsx", file_size=4096)
+    
+    widget.update_status("Reading sheets")
+    widget.progress_bar.update_file_progress(4096)
+    
+    assert "Reading sheets" in widget.progress_bar.format()
+    assert "MB" in widget.progress_bar.format()
+
+
+def test_status_message_is_cleared_by_next_operation(qtbot):
+    widget = _make_widget(qtbot)
+    widget.start_operation(FileOperationType.LOADING, "a.xlsx",
+                           status_message="Reading sheets", file_size=4096)
+    
+    widget.start_operation(FileOperationType.SAVING, "b.xlsx", file_size=4096)
+    widget.progress_bar.update_file_progress(4096)
+    
+    assert widget.progress_bar.format().startswith("Saving b.xlsx...")
+
+
+def test_files_over_2gb_use_a_scaled_range(qtbot):
+    widget = _make_widget(qtbot)
+    size = 5_000_000_000
+    widget.start_operation(FileOperationType.LOADING, "big.xlsx", file_size=size)
+    bar = widget.progress_bar
+    
+    assert bar.maximum() == 10000
+    
+    bar.update_file_progress(size // 2)
+    assert bar.value() == 5000
+    
+    bar.update_file_progress(size)
+    assert bar.value() == 10000
+    assert bar.format().endswith(f"{size / (1024 * 1024):.1f}/{size / (1024 * 1024):.1f} MB")
+
+
+def test_files_within_int_range_use_a_byte_range(qtbot):
+    widget = _make_widget(qtbot)
+    widget.start_operation(FileOperationType.SAVING, "small.xlsx", file_size=1_000_000)
+    bar = widget.progress_bar
+    
+    bar.update_file_progress(1_000_000)
+    
+    assert bar.maximum() == 1_000_000
+    assert bar.value() == 1_000_000
+
+
+def test_scale_is_reset_for_the_next_operation(qtbot):
+    widget = _make_widget(qtbot)
+    widget.start_operation(FileOperationType.LOADING, "big.xlsx", file_size=5_000_000_000)
+    widget.hide_progress()
+    
+    widget.start_operation(FileOperationType.LOADING, "small.xlsx", file_size=4096)
+    widget.progress_bar.update_file_progress(2048)
+    
+    assert widget.progress_bar.maximum() == 4096
+    assert widget.progress_bar.value() == 2048
@@ -0,0 +1,17 @@
+"""Tests for the application stylesheet cache."""
+
+from gui.styles.global_style import get_application_stylesheet
+
+
+def test_default_and_explicit_light_theme_share_one_stylesheet():
+    # install_application_stylesheet skips reinstalling by identity
+    assert get_application_stylesheet() is get_application_stylesheet('light')
+    assert get_application_stylesheet(theme='light') is get_application_stylesheet()
+
+
+def test_dark_theme_appends_overrides():
+    light = get_application_stylesheet('light')
+    dark = get_application_stylesheet('dark')
+    
+    assert dark is not light
+    assert dark.startswith(light)
@@ -0,0 +1,18 @@
+"""Tests for the lazy attributes of the gui package."""
+
+import pytest
+
+import gui
+
+
+def test_component_names_resolve_through_components_package():
+    from gui.components import FileProgressBar
+    
+    assert gui.FileProgressBar is FileProgressBar
+    assert 'FileProgressBar' in dir(gui)
+
+
+@pytest.mark.parametrize('name', ['NotAComponent', '__path_hooks__'])
+def test_unknown_names_raise_attribute_error(name):
+    with pytest.raises(AttributeError, match="module 'gui' has no attribute"):
+        getattr(gui, name)
@@ -0,0 +1,41 @@
+"""Tests for the stylesheet minifier."""
+
+from gui.styles._minify import minify_qss
+
+
+def test_strips_comments_and_whitespace():
+    stylesheet = """
+    /* Buttons */
+    QPushButton ,  QToolButton {
+        color : #495057 ;
+        padding: 4px  8px;
+    }
+    """
+    
+    assert minify_qss(stylesheet) == "QPushButton,QToolButton{color:#495057;padding:4px 8px}"
+
+
+def test_shortens_colours_and_leading_zeros_in_declarations():
+    assert minify_qss("QWidget { color: #FFFFFF; background: rgba(0, 0, 0, 0.5); }") == (
+        "QWidget{color:#FFF;background:rgba(0,0,0,.5)}"
+    )
+
+
+def test_keeps_long_colours_that_have_no_short_form():
+    assert minify_qss("QWidget { color: #112234; border-color: #aabbccdd; }") == (
+        "QWidget{color:#112234;border-color:#aabbccdd}"
+    )
+
+
+def test_leaves_id_selectors_alone():
+    assert minify_qss("QFrame#ffeedd { color: #ffeedd; }") == "QFrame#ffeedd{color:#fed}"
+
+
+def test_keeps_descendant_space_before_pseudo_state():
+    assert minify_qss("QWidget :hover { color: red; }") == "QWidget :hover{color:red}"
+
+
+def test_keeps_quoted_strings_as_written():
+    stylesheet = "QLabel { font-family: \"Segoe  UI\", 'Fira : Sans'; }"
+    
+    assert minify_qss(stylesheet) == "QLabel{font-family:\"Segoe  UI\",'Fira : Sans'}"
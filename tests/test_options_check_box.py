@@ -0,0 +1,121 @@
+"""Tests for the translation option groups."""
+
+import pytest
+
+from gui.components.check_box.options_check_box import (
+    AdvancedOptionsGroup,
+    TranslationOptionsGroup,
+)
+
+
+@pytest.fixture
+def options_group(qtbot):
+    group = TranslationOptionsGroup()
+    qtbot.addWidget(group)
+    return group
+
+
+def test_toggle_burst_emits_once_with_final_states(options_group, qapp, record_signal):
+    emitted = record_signal(options_group.options_changed)
+    
+    options_group._checkboxes['skip_formulas'].setChecked(True)
+    options_group._checkboxes['skip_empty_cells'].setChecked(True)
+    options_group._checkboxes['skip_formulas'].setChecked(False)
+    assert emitted == []
+    
+    qapp.processEvents()
+    
+    assert len(emitted) == 1
+    assert emitted[0]['skip_empty_cells'] is True
+    assert emitted[0]['skip_formulas'] is False
+
+
+def test_set_all_options_emits_once_immediately(options_group, qapp, record_signal):
+    emitted = record_signal(options_group.options_changed)
+    
+    options_group.set_all_options({'skip_formulas': True, 'batch_processing': True})
+    assert len(emitted) == 1
+    
+    qapp.processEvents()
+    assert len(emitted) == 1
+
+
+def test_direct_emission_cancels_pending_one(options_group, qapp, record_signal):
+    emitted = record_signal(options_group.options_changed)
+    
+    options_group._checkboxes['skip_formulas'].setChecked(True)
+    options_group.remove_option('batch_processing')
+    qapp.processEvents()
+    
+    assert len(emitted) == 1
+    assert 'batch_processing' not in emitted[0]
+    assert emitted[0]['skip_formulas'] is True
+
+
+def test_silent_updates_do_not_emit(options_group, qapp, record_signal):
+    emitted = record_signal(options_group.options_changed)
+    
+    options_group.set_all_options({'skip_formulas': True}, silent=True)
+    qapp.processEvents()
+    
+    assert emitted == []
+    assert options_group.get_option_state('skip_formulas') is True
+
+
+@pytest.fixture
+def advanced_group(qtbot):
+    group = AdvancedOptionsGroup()
+    qtbot.addWidget(group)
+    return group
+
+
+def test_advanced_checkboxes_are_built_on_first_expansion(advanced_group):
+    assert advanced_group._checkboxes == {}
+    assert advanced_group.get_advanced_options() == {}
+    
+    advanced_group.setChecked(True)
+    
+    assert advanced_group.get_advanced_options() == {
+        'preserve_hyperlinks': False,
+        'backup_original': False,
+        'case_sensitive': False,
+        'show_progress': False,
+    }
+
+
+def test_states_set_before_expansion_are_applied_when_built(advanced_group, qapp, record_signal):
+    emitted = record_signal(advanced_group.advanced_options_changed)
+    
+    advanced_group.set_advanced_options({'backup_original': True, 'unknown_option': True})
+    assert advanced_group._checkboxes == {}
+    
+    advanced_group.setChecked(True)
+    qapp.processEvents()
+    
+    options = advanced_group.get_advanced_options()
+    assert options['backup_original'] is True
+    assert 'unknown_option' not in options
+    assert emitted == []
+
+
+def test_advanced_toggles_emit_once_while_expanded(advanced_group, qapp, record_signal):
+    advanced_group.setChecked(True)
+    emitted = record_signal(advanced_group.advanced_options_changed)
+    
+    advanced_group.set_advanced_options({'case_sensitive': True, 'show_progress': True})
+    qapp.processEvents()
+    
+    assert len(emitted) == 1
+    assert emitted[0]['case_sensitive'] is True
+    assert emitted[0]['show_progress'] is True
+
+
+def test_collapsing_keeps_built_checkboxes(advanced_group):
+    advanced_group.setChecked(True)
+    advanced_group.set_advanced_options({'case_sensitive': True})
+    
+    advanced_group.setChecked(False)
+    assert advanced_group.get_advanced_options() == {}
+    
+    advanced_group.setChecked(True)
+    assert advanced_group.get_advanced_options()['case_sensitive'] is True
@@ -0,0 +1,82 @@
+"""Tests for the target language combo box."""
+
+import pytest
+
+from gui.components.combo_box.target_language_combo_box import TargetLanguageComboBox
+
+LANGUAGES = {'de': 'German', 'en': 'English', 'fr': 'French', 'es': 'Spanish'}
+
+
+@pytest.fixture
+def combo(qtbot):
+    widget = TargetLanguageComboBox()
+    qtbot.addWidget(widget)
+    widget.load_languages(LANGUAGES)
+    return widget
+
+
+def _items(combo):
+    return [combo.itemText(i) for i in range(combo.count())]
+
+
+def test_excluded_languages_are_removed_in_order(combo):
+    combo.exclude_languages(['fr', 'de'])
+    
+    assert _items(combo) == ['English', 'Spanish']
+    assert combo.get_language_list() == ('en', 'es')
+
+
+def test_row_lookup_follows_the_rebuilt_model(combo):
+    combo.exclude_languages(['en'])
+    
+    combo.set_recommended_language('es')
+    
+    assert combo.currentText() == 'Spanish'
+    assert combo.get_selected_language() == 'es'
+
+
+def test_kept_selection_does_not_signal(combo, record_signal):
+    combo.set_language('es')
+    emitted = record_signal(combo.language_changed)
+    
+    combo.exclude_languages(['fr'])
+    
+    assert combo.get_selected_language() == 'es'
+    assert emitted == []
+
+
+def test_excluded_selection_moves_to_next_language_once(combo, record_signal):
+    combo.set_language('fr')
+    emitted = record_signal(combo.language_changed)
+    
+    combo.exclude_languages(['fr', 'de'])
+    
+    assert combo.get_selected_language() == 'es'
+    assert emitted == ['es']
+
+
+def test_excluded_last_selection_moves_to_new_last_language(combo):
+    combo.set_language('es')
+    
+    combo.exclude_languages(['es'])
+    
+    assert combo.get_selected_language() == 'de'
+
+
+def test_exclusions_apply_to_later_loads(combo):
+    combo.exclude_languages(['de'])
+    
+    combo.load_languages(LANGUAGES)
+    
+    assert _items(combo) == ['English', 'French', 'Spanish']
+
+
+def test_unknown_codes_leave_the_model_untouched(combo, record_signal):
+    combo.set_language('fr')
+    emitted = record_signal(combo.language_changed)
+    
+    combo.exclude_languages(['xx'])
+    
+    assert _items(combo) == ['English', 'French', 'German', 'Spanish']
+    assert combo.get_selected_language() == 'fr'
+    assert emitted == []
@@ -0,0 +1,57 @@
+"""Tests for the translation progress container."""
+
+from gui.components.progress_bar.translation_progress_bar import ProgressBarContainer
+
+
+class _FakeElapsedTimer:
+    """Stand-in for QElapsedTimer with a manually advanced clock."""
+    
+    def __init__(self):
+        self.ns = 0
+    
+    def isValid(self):
+        return True
+    
+    def nsecsElapsed(self):
+        return self.ns
+    
+    def invalidate(self):
+        pass
+
+
+def _start(qtbot):
+    container = ProgressBarContainer()
+    qtbot.addWidget(container)
+    container.start_operation("Translating", total_items=1000)
+    clock = _FakeElapsedTimer()
+    container._elapsed = clock
+    return container, clock
+
+
+def test_rate_label_changes_at_most_once_per_second(qtbot):
+    container, clock = _start(qtbot)
+    
+    clock.ns = 200_000_000
+    container.update_progress(10)
+    first_text = container.rate_label.text()
+    assert first_text == "Rate: 50.0/s"
+    
+    clock.ns = 900_000_000
+    container.update_progress(90)
+    assert container.rate_label.text() == first_text
+    
+    clock.ns = 1_000_000_000
+    container.update_progress(100)
+    assert container.rate_label.text() == "Rate: 100.0/s"
+    assert container.time_label.text() == "Elapsed: 00:01"
+
+
+def test_details_are_cleared_when_hidden(qtbot):
+    container, clock = _start(qtbot)
+    clock.ns = 500_000_000
+    container.update_progress(5)
+    
+    container.hide_progress()
+    
+    assert container.time_label.text() == ""
+    assert container.rate_label.text() == ""
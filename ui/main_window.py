@@ -20,6 +20,7 @@ from translator.batch_processor import TranslationManager, TranslationTask
 from excel.excel_reader import ExcelReader
 from excel.excel_writer import ExcelWriter
 from excel.utils import ExcelUtils
+from gui.resources import ASSETS_DIR
 
 class TranslationThread(QThread):
     """Thread for handling translation operations."""
@@ -467,7 +468,7 @@ class ExcelTranslatorApp(QMainWindow):
     
     def apply_theme(self):
         """Apply the dark theme."""
-        theme_file = Path(__file__).parent.parent / 'assets' / 'dark_theme.qss'
+        theme_file = ASSETS_DIR / 'dark_theme.qss'
         try:
             if theme_file.exists():
                 with open(theme_file, 'r', encoding='utf-8') as f: